@@ -1,4 +1,4 @@
-from poker_game.core.player import Player
+from poker_game.core.player import Player, KIND_BOT
 from poker_game.core.events import Action
 from abc import abstractmethod
 import random
@@ -10,6 +10,8 @@ if TYPE_CHECKING:
 
 
 class BotPlayer(Player):
+    kind = KIND_BOT
+
     @abstractmethod
     def make_decision(self, game_state: 'GameState') -> Action:
         pass
@@ -15,15 +15,22 @@ class Card:
             raise ValueError(f"Invalid suit: {suit}")
         self.rank = rank
         self.suit = suit
+        self._str = f"{rank}{suit}" # Built once, interfaces render cards on every state display
+
+    def __str__(self) -> str:
+        return self._str
 
     def __repr__(self) -> str:
-        return f"{self.rank}{self.suit}"
+        return self._str
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Card):
             return NotImplemented
         return self.rank == other.rank and self.suit == other.suit
 
+    def __hash__(self) -> int: # Consistent with __eq__, lets cards key caches
+        return hash(self._str)
+
     def __lt__(self, other) -> bool: # For sorting cards
         if not isinstance(other, Card):
             return NotImplemented
@@ -32,13 +39,19 @@ class Card:
     def rank_value(self) -> int:
         return RANK_VALUES[self.rank]
 
+# The 52 cards, built once. Decks deal these same instances (cards are never mutated),
+# so lookups in tables keyed by card hit on identity without calling __eq__.
+ALL_CARDS: List[Card] = [Card(rank, suit) for suit in SUITS for rank in RANKS]
+# JSON form of each card for web payloads; the dicts are shared, never mutate them
+CARD_JSON: Dict[Card, Dict[str, str]] = {card: {"rank": card.rank, "suit": card.suit} for card in ALL_CARDS}
+
 class Deck:
     def __init__(self):
         self.cards: List[Card] = self._create_deck()
         self.shuffle()
 
     def _create_deck(self) -> List[Card]:
-        return [Card(rank, suit) for suit in SUITS for rank in RANKS]
+        return list(ALL_CARDS)
 
     def shuffle(self) -> None:
         random.shuffle(self.cards)
@@ -1,6 +1,5 @@
 from typing import List, Optional, Tuple, Dict, Any
-from poker_game.core.player import Player, HumanPlayer
-from poker_game.core.bot_player import BotPlayer # For type checking
+from poker_game.core.player import Player, KIND_HUMAN, KIND_BOT
 from poker_game.core.cards import Deck # Corrected import
 from poker_game.core.game_state import GameState
 from poker_game.core.rules import TexasHoldemRules
@@ -303,7 +302,7 @@ class GameEngine:
 
         for player in self._active_round_players:
             self.event_system.post(GameEvent(type="cards_dealt_to_player", data={"player_id": player.player_id, "cards_count": len(player.hole_cards)}))
-            if isinstance(player, HumanPlayer):
+            if player.kind == KIND_HUMAN:
                 self.interface.display_player_cards(player)
 
     def _deal_community_cards(self, phase: str):
@@ -388,16 +387,16 @@ class GameEngine:
             player = acting_order[current_player_index % len(acting_order)] # Use modulo for safety, though index should reset
 
             # display_game_state before asking for action
-            self.interface.display_game_state(self.game_state, current_player_id=player.player_id, show_hole_cards_for_player=player.player_id if isinstance(player, HumanPlayer) else None)
+            self.interface.display_game_state(self.game_state, current_player_id=player.player_id, show_hole_cards_for_player=player.player_id if player.kind == KIND_HUMAN else None)
 
             allowed_actions = self.rules.get_allowed_actions(player, self.game_state)
 
             action: Action
             if not allowed_actions: # Should only happen if player is all-in and no valid action like check
                  action = Action(type="check", player_id=player.player_id)
-            elif isinstance(player, HumanPlayer):
+            elif player.kind == KIND_HUMAN:
                 action = self.interface.get_player_action(player, self.game_state, allowed_actions)
-            elif isinstance(player, BotPlayer):
+            elif player.kind == KIND_BOT:
                 action = player.make_decision(self.game_state)
             else: # Should not happen
                 action = Action(type="fold", player_id=player.player_id)
@@ -5,7 +5,13 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from poker_game.core.game_state import GameState # To avoid circular import
 
+# Player kinds, checked with a plain int compare instead of isinstance() in hot paths
+KIND_HUMAN = 1
+KIND_BOT = 2
+
 class Player(ABC):
+    kind = 0 # KIND_HUMAN or KIND_BOT, set by the concrete subclasses
+
     def __init__(self, player_id: str, stack: int):
         self.player_id = player_id
         self.stack = stack
@@ -41,6 +47,8 @@ class Player(ABC):
         return f"{self.__class__.__name__}(id='{self.player_id}', stack={self.stack})"
 
 class HumanPlayer(Player):
+    kind = KIND_HUMAN
+
     def make_decision(self, game_state: 'GameState') -> Action:
         # This will be handled by the ConsoleInterface or other UI
         # For now, let's return a placeholder or raise NotImplementedError
@@ -1,5 +1,5 @@
 import unittest
-from poker_game.core.cards import Card, Deck, HandEvaluator, SUITS, RANKS, RANK_VALUES
+from poker_game.core.cards import Card, Deck, HandEvaluator, SUITS, RANKS, RANK_VALUES, CARD_JSON
 
 class TestCard(unittest.TestCase):
     def test_card_creation(self):
@@ -23,6 +23,8 @@ class TestCard(unittest.TestCase):
         self.assertEqual(card1, card2)
         self.assertNotEqual(card1, card3)
         self.assertNotEqual(card1, "K♦") # Test against different type
+        self.assertEqual(hash(card1), hash(card2))
+        self.assertEqual(len({card1, card2, card3}), 2)
 
     def test_card_sorting_and_rank_value(self):
         card_2c = Card('2', '♣')
@@ -48,6 +50,13 @@ class TestDeck(unittest.TestCase):
         # Check for unique cards
         self.assertEqual(len(set(str(c) for c in deck.cards)), 52)
 
+    def test_card_json_table(self):
+        self.assertEqual(len(CARD_JSON), 52)
+        # Decks deal the table's own instances, and equal cards built elsewhere still find their entry
+        for card in Deck().cards:
+            self.assertIs(CARD_JSON[card], CARD_JSON[Card(card.rank, card.suit)])
+        self.assertEqual(CARD_JSON[Card('A', '♠')], {"rank": "A", "suit": "♠"})
+
     def test_deck_shuffle(self):
         deck1 = Deck()
         # deck2 = Deck() # deck2 is shuffled by default on init - Not needed for this test logic
@@ -0,0 +1,40 @@
+import unittest
+from unittest.mock import patch
+from poker_game.interfaces.console_interface import ConsoleInterface
+from poker_game.core.game_state import GameState
+from poker_game.core.player import HumanPlayer
+
+class TestConsoleInterfaceConfirmActions(unittest.TestCase):
+    def setUp(self):
+        self.player = HumanPlayer(player_id="Alice", stack=1000)
+        self.other = HumanPlayer(player_id="Bob", stack=1000)
+        self.game_state = GameState(players=[self.player, self.other])
+        self.bet_allowed = {"fold": True, "check": True, "bet": {"min": 20, "max": 1000}}
+        self.raise_allowed = {"fold": True, "call": 20, "raise": {"min_total_bet": 40, "max_total_bet": 1000}}
+
+    def _act(self, interface, allowed_actions, inputs):
+        with patch("builtins.input", side_effect=inputs) as mock_input, patch("builtins.print"):
+            action = interface.get_player_action(self.player, self.game_state, allowed_actions)
+        return action, mock_input
+
+    def test_bet_without_confirmation(self):
+        interface = ConsoleInterface(game_mode="normal", confirm_actions=False)
+        action, mock_input = self._act(interface, self.bet_allowed, ["bet 50"])
+        self.assertEqual((action.type, action.amount), ("bet", 50))
+        self.assertEqual(mock_input.call_count, 1) # No y/n prompt
+
+    def test_raise_without_confirmation(self):
+        self.game_state.current_bet_to_match = 20
+        interface = ConsoleInterface(game_mode="normal", confirm_actions=False)
+        action, mock_input = self._act(interface, self.raise_allowed, ["raise 60"])
+        self.assertEqual((action.type, action.amount), ("raise", 60))
+        self.assertEqual(mock_input.call_count, 1)
+
+    def test_default_asks_for_confirmation(self):
+        interface = ConsoleInterface(game_mode="normal")
+        action, mock_input = self._act(interface, self.bet_allowed, ["bet 50", "n", "bet 60", "y"])
+        self.assertEqual((action.type, action.amount), ("bet", 60)) # The declined bet was re-prompted
+        self.assertEqual(mock_input.call_count, 4)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+from poker_game.storage.memory_storage import MemoryRepository
+from poker_game.core.game_state import GameState
+from poker_game.core.player import HumanPlayer
+
+class TestMemoryRepository(unittest.TestCase):
+    def setUp(self):
+        self.player1 = HumanPlayer(player_id="Alice", stack=1000)
+        self.player2 = HumanPlayer(player_id="Bob", stack=1000)
+        self.game_state = GameState(players=[self.player1, self.player2], pot_size=0)
+        self.repo = MemoryRepository()
+
+    def test_load_missing_game(self):
+        self.assertIsNone(self.repo.load_game("missing"))
+
+    def test_resave_overwrites(self):
+        self.repo.save_game("g1", self.game_state)
+        self.player1.place_bet(50) # Same GameState object, mutated between saves
+        self.game_state.pot_size = 50
+        self.repo.save_game("g1", self.game_state)
+
+        loaded = self.repo.load_game("g1")
+        self.assertEqual(loaded.pot_size, 50)
+        self.assertEqual(loaded.players[0].stack, 950)
+        self.assertEqual(self.repo.list_saved_games(), ["g1"])
+
+    def test_delete_game(self):
+        self.repo.save_game("g1", self.game_state)
+        self.repo.delete_game("g1")
+        self.assertIsNone(self.repo.load_game("g1"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
-from poker_game.core.player import Player, HumanPlayer
+from poker_game.core.player import Player, HumanPlayer, KIND_HUMAN, KIND_BOT
+from poker_game.core.bot_player import RandomBot
 from poker_game.core.cards import Card
 # GameState and Action might be needed if we test make_decision, but for now, focus on basic player mechanics.
 
@@ -100,5 +101,9 @@ class TestPlayer(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             self.player.make_decision(None) # game_state is not used by this placeholder
 
+    def test_player_kind(self):
+        self.assertEqual(self.player.kind, KIND_HUMAN)
+        self.assertEqual(RandomBot(player_id="bot", stack=1000).kind, KIND_BOT)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,143 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+from poker_game.interfaces.web_interface import WebInterface, _FULL_UPDATE_EVERY
+from poker_game.core.game_state import GameState
+from poker_game.core.player import HumanPlayer
+from poker_game.core.bot_player import RandomBot
+from poker_game.core.cards import Card
+from poker_game.core.events import Action
+
+class TestWebInterfaceUpdates(unittest.TestCase):
+    def setUp(self):
+        # A MagicMock never runs the emitter task, so queued emits stay in _emit_q for inspection
+        self.wi = WebInterface(MagicMock(), "P1")
+        self.human = HumanPlayer(player_id="P1", stack=1000)
+        self.bot = RandomBot(player_id="B1", stack=1000)
+        self.human.hole_cards = [Card('A', '♠'), Card('K', '♠')]
+        self.bot.hole_cards = [Card('2', '♥'), Card('7', '♦')]
+        self.game_state = GameState(players=[self.human, self.bot])
+
+    def _drain(self):
+        items = list(self.wi._emit_q)
+        self.wi._emit_q.clear()
+        return items
+
+    def test_first_update_is_full_then_delta_after_stack_change(self):
+        self.wi._broadcast_state(self.game_state)
+        (name, payload, _, _, _), = self._drain()
+        self.assertEqual(name, 'game_update')
+        self.assertEqual(payload["game_state"]["players"][1]["stack"], 1000)
+
+        self.bot.stack = 900
+        self.wi._broadcast_state(self.game_state)
+        (name, payload, _, _, _), = self._drain()
+        self.assertEqual(name, 'game_update_delta')
+        self.assertEqual(payload["state_delta"], {})
+        self.assertEqual(payload["players_delta"], [{"index": 1, "changes": {"stack": 900}}])
+
+    def test_no_change_and_no_event_sends_nothing(self):
+        self.wi._broadcast_state(self.game_state)
+        self._drain()
+        self.wi._broadcast_state(self.game_state)
+        self.assertEqual(self._drain(), [])
+
+    def test_full_update_on_phase_change(self):
+        self.wi._broadcast_state(self.game_state)
+        self._drain()
+        self.game_state.game_phase = "flop"
+        self.wi._broadcast_state(self.game_state)
+        (name, payload, _, _, _), = self._drain()
+        self.assertEqual(name, 'game_update')
+        self.assertEqual(payload["game_state"]["game_phase"], "flop")
+
+    def test_full_update_after_delta_limit(self):
+        self.wi._broadcast_state(self.game_state)
+        self._drain()
+        for i in range(_FULL_UPDATE_EVERY):
+            self.bot.stack -= 10
+            self.wi._broadcast_state(self.game_state)
+            self.assertEqual(self._drain()[0][0], 'game_update_delta')
+        self.bot.stack -= 10
+        self.wi._broadcast_state(self.game_state)
+        self.assertEqual(self._drain()[0][0], 'game_update')
+
+    def test_full_update_after_send_sync(self):
+        self.wi.register_sid("P1", "H")
+        self.wi._broadcast_state(self.game_state)
+        self._drain()
+        self.wi.send_sync("H", self.game_state)
+        self._drain()
+
+        self.bot.stack = 900
+        self.wi._broadcast_state(self.game_state)
+        messages = {item[3]: item[0] for item in self._drain()} # to -> event name
+        self.assertEqual(messages["H"], 'game_update') # The synced client gets a fresh base
+        self.assertEqual(messages[None], 'game_update_delta') # The public stream was not resynced
+
+    def test_sync_is_queued_behind_pending_deltas(self):
+        self.wi._broadcast_state(self.game_state)
+        self.bot.stack = 900
+        self.wi._broadcast_state(self.game_state)
+        self.wi.send_sync("other", self.game_state)
+        self.assertEqual([item[0] for item in self._drain()], ['game_update', 'game_update_delta', 'sync'])
+
+    def test_public_view_hides_human_cards_and_human_view_goes_to_its_sid(self):
+        self.wi.register_sid("P1", "H")
+        self.wi._broadcast_state(self.game_state)
+        public, private = self._drain()
+        self.assertEqual((public[3], public[4]), (None, "H")) # Broadcast, skipping the human's socket
+        self.assertEqual(public[1]["game_state"]["players"][0]["hole_cards"], ["HIDDEN", "HIDDEN"])
+        self.assertEqual(private[3], "H")
+        self.assertNotEqual(private[1]["game_state"]["players"][0]["hole_cards"], ["HIDDEN", "HIDDEN"])
+        self.assertEqual(private[1]["game_state"]["players"][1]["hole_cards"], ["HIDDEN", "HIDDEN"])
+
+class TestWebInterfaceActions(unittest.TestCase):
+    def setUp(self):
+        self.wi = WebInterface(MagicMock(), "P1")
+        self.human = HumanPlayer(player_id="P1", stack=1000)
+        self.game_state = GameState(players=[self.human, RandomBot(player_id="B1", stack=1000)])
+        self.allowed = {"fold": True, "check": True}
+
+    def test_submit_action_rejects_wrong_player_and_second_submit(self):
+        result = []
+        waiter = threading.Thread(target=lambda: result.append(
+            self.wi.get_player_action(self.human, self.game_state, self.allowed)))
+        waiter.start()
+        for _ in range(200): # The slot is armed before the request is queued
+            if self.wi._emit_q:
+                break
+            threading.Event().wait(0.01)
+
+        self.assertFalse(self.wi.submit_action(Action(type="check", player_id="B1")))
+        self.assertTrue(self.wi.submit_action(Action(type="check", player_id="P1")))
+        self.assertFalse(self.wi.submit_action(Action(type="fold", player_id="P1")))
+        waiter.join(5)
+        self.assertEqual((result[0].type, result[0].player_id), ("check", "P1"))
+
+    def test_submit_action_without_pending_request(self):
+        self.assertFalse(self.wi.submit_action(Action(type="check", player_id="P1")))
+
+    def test_timeout_returns_fold(self):
+        with patch.object(self.wi._action_ready, 'wait', return_value=False) as mock_wait:
+            action = self.wi.get_player_action(self.human, self.game_state, self.allowed)
+        mock_wait.assert_called_once_with(120)
+        self.assertEqual((action.type, action.player_id), ("fold", "P1"))
+        self.assertIsNone(self.wi._awaiting_player_id)
+
+class TestWebInterfaceEmitter(unittest.TestCase):
+    def test_close_flushes_queue_then_exits(self):
+        socketio = MagicMock()
+        socketio.start_background_task.side_effect = lambda target: threading.Thread(target=target, daemon=True)
+        wi = WebInterface(socketio, "P1")
+        for i in range(5):
+            wi._emit('show_message', {'message': str(i)})
+        wi.close()
+        wi._emitter.start()
+        wi._emitter.join(5)
+
+        self.assertFalse(wi._emitter.is_alive())
+        self.assertEqual([c.args[1]['message'] for c in socketio.emit.call_args_list], ['0', '1', '2', '3', '4'])
+
+if __name__ == '__main__':
+    unittest.main()
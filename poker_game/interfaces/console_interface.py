@@ -1,24 +1,84 @@
 from poker_game.interfaces.base_interface import GameInterface
-from poker_game.core.player import Player, HumanPlayer
-from poker_game.core.game_state import GameState
-from poker_game.core.events import Action, GameEvent
-from poker_game.core.cards import Card # For type hinting if needed
-from typing import Optional # Added Optional
+from poker_game.core.player import KIND_HUMAN
+from poker_game.core.events import Action
+from typing import TYPE_CHECKING, Optional # Added Optional
+import sys
+
+if TYPE_CHECKING:
+    from poker_game.core.player import Player
+    from poker_game.core.game_state import GameState
+    from poker_game.core.events import GameEvent
+
+# Fixed console banners, built once at import.
+_ROUND_SEP = "=" * 50
+_WELCOME = (
+    "🎰 TEXAS HOLD'EM POKER 🎰\n"
+    f"{_ROUND_SEP}\n"
+    "Welcome to Texas Hold'em Poker!\n"
+    f"{_ROUND_SEP}\n"
+    "\n" # Empty line for spacing
+)
+_ROUND_START = (
+    "\n--- Starting Round {round_number} ---\n"
+    f"{_ROUND_SEP}\n"
+    "STARTING ROUND {round_number}\n"
+    f"{_ROUND_SEP}\n"
+)
+_WIN_EMOJI_LINE = "🎉" * 20
+_WIN_HEADER = f"\n{_WIN_EMOJI_LINE}\nHAND RESULTS\n{_WIN_EMOJI_LINE}\n"
+_WIN_HEADER_UTF8 = _WIN_HEADER.encode("utf-8")
+
+
+def _write_preencoded(text: str, data: bytes) -> None:
+    """Writes text whose UTF-8 encoding is already known, skipping the text layer when stdout is UTF-8."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    encoding = (getattr(sys.stdout, "encoding", None) or "").lower().replace("-", "")
+    if buffer is not None and encoding == "utf8":
+        sys.stdout.flush() # Keep anything already written through the text layer in order
+        buffer.write(data)
+    else:
+        sys.stdout.write(text)
+
+# Commands checked on every prompt, kept as constants rather than rebuilt per input.
+_QUIT_TOKENS = frozenset(("quit", "exit"))
+_AMOUNT_TOKENS = frozenset(("bet", "raise"))
+
+_NAME_PROMPT = "Enter name for Human Player "
+
+# Log line per player_action type. The 'amount' for a raise action in GameEvent data is the total bet amount.
+_ACTION_FMT = {
+    "small_blind": "{pid} posts Small Blind ({amt})",
+    "big_blind": "{pid} posts Big Blind ({amt})",
+    "fold": "{pid} FOLDS",
+    "check": "{pid} CHECKS",
+    "call": "{pid} CALLS {amt}",
+    "bet": "{pid} BETS {amt}",
+    "raise": "{pid} RAISES to {amt}",
+}
 
 class ConsoleInterface(GameInterface):
-    def __init__(self, game_mode: str = "normal"): # Default to normal if not specified
+    def __init__(self, game_mode: str = "normal", confirm_actions: bool = True): # Default to normal if not specified
         self.game_mode = game_mode
+        # When False, bet/raise are submitted without the y/n prompt (scripted normal-mode runs).
+        self.confirm_actions = confirm_actions
+        # Normal-mode command dispatch. Each handler returns an Action to submit, or None to re-prompt.
+        self._action_handlers = {
+            "fold": self._handle_fold,
+            "check": self._handle_check,
+            "call": self._handle_call,
+            "bet": self._handle_bet,
+            "raise": self._handle_raise,
+            "quit": self._handle_quit,
+            "exit": self._handle_quit,
+        }
+        self._community_cards_str: Optional[str] = None # Cached board text for display_game_state
         self._print_welcome_banner()
 
     def _print_welcome_banner(self):
-        print("🎰 TEXAS HOLD'EM POKER 🎰")
-        print("==================================================")
-        print("Welcome to Texas Hold'em Poker!")
-        print("==================================================")
-        print() # Empty line for spacing
-
-    def get_player_action(self, player: Player, game_state: GameState, allowed_actions: dict) -> Action:
-        if not isinstance(player, HumanPlayer):
+        sys.stdout.write(_WELCOME)
+
+    def get_player_action(self, player: 'Player', game_state: 'GameState', allowed_actions: dict) -> Action:
+        if player.kind != KIND_HUMAN:
             # Bots decide on their own, this method might not be called for them by GameEngine directly if bots have their own logic path.
             # Or, if it is, it should just trigger their internal decision.
             # For now, let's assume GameEngine calls player.make_decision() which for HumanPlayer would delegate to this.
@@ -30,220 +90,257 @@ class ConsoleInterface(GameInterface):
 
         print(f"\n{player.player_id}, it's your turn!")
 
-        action_map = {} # For numbered choices if we re-implement
         possible_choices_display = [] # For user-friendly list
 
         amount_to_call = game_state.current_bet_to_match - player.current_bet
 
-        if allowed_actions.get("fold"): possible_choices_display.append("fold")
-        if allowed_actions.get("check") and amount_to_call <= 0: possible_choices_display.append("check")
-        if allowed_actions.get("call") and amount_to_call > 0: possible_choices_display.append("call")
-        if allowed_actions.get("bet"): possible_choices_display.append("bet <amount>")
-        if allowed_actions.get("raise"): possible_choices_display.append("raise <total_amount>")
+        # Look up each allowed action once; the menu and smoke mode below only read these locals.
+        fold_ok = bool(allowed_actions.get("fold"))
+        check_ok = bool(allowed_actions.get("check"))
+        call_amt = allowed_actions.get("call")
+        bet_details = allowed_actions.get("bet")
+        raise_details = allowed_actions.get("raise")
 
-        print(f"Valid actions: {', '.join(possible_choices_display)}")
-        print("------------------------------------------------------------")
-        print("Action explanations:")
-        if "fold" in possible_choices_display: print("- fold: Give up your hand")
-        if "check" in possible_choices_display: print("- check: Pass without betting (only when no bet to call)")
-        if "call" in possible_choices_display:
-            call_cost = min(player.stack, amount_to_call)
-            print(f"- call: Match the current bet (costs {call_cost})")
-        if "bet <amount>" in possible_choices_display:
-            min_bet_val = allowed_actions.get("bet", {}).get("min", game_state.big_blind)
-            max_bet_val = allowed_actions.get("bet", {}).get("max", player.stack)
-            print(f"- bet <amount>: Make a bet (e.g., 'bet 50'). Min: {min_bet_val}, Max: {max_bet_val} (your stack)")
-        if "raise <total_amount>" in possible_choices_display:
-            min_raise_val = allowed_actions.get("raise", {}).get("min_total_bet", game_state.current_bet_to_match + game_state.big_blind)
-            max_raise_val = allowed_actions.get("raise", {}).get("max_total_bet", player.current_bet + player.stack)
-            print(f"- raise <total_amount>: Raise the current bet (e.g., 'raise 100'). Min total: {min_raise_val}, Max total: {max_raise_val} (all-in)")
-        print("------------------------------------------------------------")
+        if fold_ok: possible_choices_display.append("fold")
+        if check_ok and amount_to_call <= 0: possible_choices_display.append("check")
+        if call_amt and amount_to_call > 0: possible_choices_display.append("call")
+        if bet_details: possible_choices_display.append("bet <amount>")
+        if raise_details: possible_choices_display.append("raise <total_amount>")
 
+        choices_str = ", ".join(possible_choices_display) # Reused by every re-prompt below
+        print(f"Valid actions: {choices_str}")
+        if self.game_mode == "normal": # Smoke mode acts on its own and never reads the explanations
+            self._print_action_help(possible_choices_display, allowed_actions, player, game_state, amount_to_call)
 
         if self.game_mode == "smoke":
+            # Precedence: check, call (all-in for less if short), fold, then the first listed bet/raise.
             print(f"SMOKE MODE: {player.player_id} auto-acting.")
-            if allowed_actions.get("check") and (game_state.current_bet_to_match - player.current_bet) <=0:
+            if check_ok and amount_to_call <= 0:
                 print(f"SMOKE MODE: {player.player_id} auto-checking.")
                 return Action(type="check", player_id=player.player_id)
-            elif allowed_actions.get("call") and (game_state.current_bet_to_match - player.current_bet) > 0:
-                 actual_call_amount = allowed_actions.get("call")
-                 if isinstance(actual_call_amount, int) and actual_call_amount > 0 and actual_call_amount <= player.stack :
-                    print(f"SMOKE MODE: {player.player_id} auto-calling {actual_call_amount}.")
-                    return Action(type="call", amount=actual_call_amount, player_id=player.player_id)
-                 elif isinstance(actual_call_amount, int) and actual_call_amount > 0 and actual_call_amount > player.stack and player.stack > 0:
-                    print(f"SMOKE MODE: {player.player_id} auto-calling ALL-IN for {player.stack}.")
-                    return Action(type="call", amount=player.stack, player_id=player.player_id)
-            if allowed_actions.get("fold"):
+            if call_amt and amount_to_call > 0:
+                call_amount = call_amt if call_amt <= player.stack else player.stack
+                if call_amount > 0:
+                    if call_amount == call_amt:
+                        print(f"SMOKE MODE: {player.player_id} auto-calling {call_amount}.")
+                    else:
+                        print(f"SMOKE MODE: {player.player_id} auto-calling ALL-IN for {call_amount}.")
+                    return Action(type="call", amount=call_amount, player_id=player.player_id)
+            if fold_ok:
                 print(f"SMOKE MODE: {player.player_id} auto-folding.")
                 return Action(type="fold", player_id=player.player_id)
             if allowed_actions:
-                first_action_type = list(allowed_actions.keys())[0]
-                if first_action_type == "bet" and isinstance(allowed_actions["bet"], dict):
-                    return Action(type="bet", amount=allowed_actions["bet"]["min"], player_id=player.player_id)
-                elif first_action_type == "raise" and isinstance(allowed_actions["raise"], dict):
-                     return Action(type="raise", amount=allowed_actions["raise"]["min_total_bet"], player_id=player.player_id)
-                return Action(type="check", player_id=player.player_id)
-            else:
-                return Action(type="check", player_id=player.player_id)
+                first_action_type = next(iter(allowed_actions))
+                if first_action_type == "bet" and isinstance(bet_details, dict):
+                    return Action(type="bet", amount=bet_details["min"], player_id=player.player_id)
+                if first_action_type == "raise" and isinstance(raise_details, dict):
+                    return Action(type="raise", amount=raise_details["min_total_bet"], player_id=player.player_id)
+            return Action(type="check", player_id=player.player_id)
 
         # NORMAL MODE: Interactive input loop
         else:
             while True:
                 try:
                     choice = input(f"Enter your action for {player.player_id}: ").strip().lower()
-                    parts = choice.split()
-                    action_type_input = parts[0]
-
-                    action_amount = 0
-                    if len(parts) > 1:
-                        try:
-                            action_amount = int(parts[1])
-                        except ValueError:
-                            print("Invalid amount. Please enter a number for the amount.")
-                            continue
-
-                    # Validate action type
-                    if action_type_input not in allowed_actions and not (action_type_input in ["bet", "raise"] and "<amount>" in "".join(possible_choices_display)):
-                        print(f"Invalid action type: '{action_type_input}'. Valid actions: {', '.join(possible_choices_display)}")
+                    # Split off the command word; anything after it is the amount for bet/raise.
+                    sep = choice.find(' ')
+                    if sep == -1:
+                        verb, rest = choice, ""
+                    else:
+                        verb, rest = choice[:sep], choice[sep + 1:].lstrip()
+
+                    if verb == "help":
+                        self._print_action_help(possible_choices_display, allowed_actions, player, game_state, amount_to_call)
                         continue
 
-                    # Specific action validation
-                    if action_type_input == "fold":
-                        if allowed_actions.get("fold"):
-                            return Action(type="fold", player_id=player.player_id)
-                        else: print("Action 'fold' is not allowed right now.") # Should not happen if listed
-
-                    elif action_type_input == "check":
-                        if allowed_actions.get("check") and amount_to_call <=0:
-                            return Action(type="check", player_id=player.player_id)
-                        else: print("Action 'check' is not allowed (must call or bet is pending).")
-
-                    elif action_type_input == "call":
-                        if allowed_actions.get("call") and amount_to_call > 0:
-                            call_cost = min(player.stack, amount_to_call) # This is what player.place_bet will take
-                            # The amount in Action for call should be the amount_to_call for matching purposes,
-                            # player.place_bet will handle if it's an all-in for less.
-                            # The 'call' value in allowed_actions IS the correct amount player needs to put in.
-                            return Action(type="call", amount=allowed_actions["call"], player_id=player.player_id)
-                        else: print("Action 'call' is not allowed or nothing to call.")
-
-                    elif action_type_input == "bet":
-                        bet_details = allowed_actions.get("bet")
-                        if bet_details and amount_to_call <= 0:
-                            if len(parts) < 2: print("Please specify bet amount (e.g., 'bet 50')."); continue
-                            min_bet_val = bet_details["min"]
-                            max_bet_val = bet_details["max"]
-                            if not (min_bet_val <= action_amount <= max_bet_val):
-                                print(f"Invalid bet amount. Must be between {min_bet_val} and {max_bet_val}. Your stack: {player.stack}")
-                                continue
-
-                            confirm = input(f"Confirm bet {action_amount} chips? (y/n): ").strip().lower()
-                            if confirm == 'y':
-                                return Action(type="bet", amount=action_amount, player_id=player.player_id)
-                            else: print("Bet cancelled."); continue
-                        else: print("Action 'bet' is not allowed now (e.g. facing a bet).")
-
-                    elif action_type_input == "raise":
-                        raise_details = allowed_actions.get("raise")
-                        if raise_details and amount_to_call > 0 :
-                            if len(parts) < 2: print("Please specify total amount for raise (e.g., 'raise 100')."); continue
-                            min_raise_total = raise_details["min_total_bet"]
-                            max_raise_total = raise_details["max_total_bet"]
-
-                            # action_amount is the TOTAL bet player wants to make for the round
-                            if not (min_raise_total <= action_amount <= max_raise_total):
-                                print(f"Invalid raise amount. Total bet must be between {min_raise_total} and {max_raise_total}. Your stack: {player.stack}")
-                                continue
-
-                            # This additional check from before seems correct to ensure it's a valid raise value.
-                            if action_amount <= game_state.current_bet_to_match :
-                                print(f"Must raise to more than current bet to match ({game_state.current_bet_to_match}).")
-                                continue
-
-                            confirm = input(f"Confirm raise to total {action_amount} chips? (y/n): ").strip().lower()
-                            if confirm == 'y':
-                                return Action(type="raise", amount=action_amount, player_id=player.player_id)
-                            else: print("Raise cancelled."); continue
-                        else: print("Action 'raise' is not allowed now (e.g. no prior bet to raise).")
-                    elif action_type_input in ["quit", "exit"]:
-                        confirm_quit = ""
-                        try:
-                            confirm_quit = input("Are you sure you want to quit the game? (y/n): ").strip().lower()
-                        except EOFError:
-                            print("\nEOFError during quit confirmation. Assuming 'n'.")
-                            confirm_quit = "n" # Default to not quitting if input fails
-
-                        if confirm_quit == 'y':
-                            return Action(type="quit", player_id=player.player_id)
-                        else:
-                            print("Quit cancelled.")
-                            continue # Re-prompt for action
-                    else:
-                        # This case should ideally be caught by the initial action_type_input check
-                        print(f"Unrecognized action command: '{action_type_input}'. Valid actions: {', '.join(possible_choices_display)}")
+                    handler = self._action_handlers.get(verb)
+                    if handler is None:
+                        print(f"Invalid action type: '{verb}'. Valid actions: {choices_str}")
+                        continue
+
+                    # Validate action type ("quit"/"exit" are always accepted, the engine allows them at any time)
+                    if verb not in _QUIT_TOKENS and verb not in allowed_actions and not (verb in _AMOUNT_TOKENS and (bet_details or raise_details)):
+                        print(f"Invalid action type: '{verb}'. Valid actions: {choices_str}")
+                        continue
+
+                    result = handler(player, game_state, allowed_actions, amount_to_call, rest)
+                    if isinstance(result, Action):
+                        return result
 
                 except EOFError:
                     print("\nEOFError: Input stream ended. This can happen in non-interactive environments.")
                     print("Defaulting to FOLD action for this turn.")
-                    if allowed_actions.get("fold"):
+                    if fold_ok:
                         return Action(type="fold", player_id=player.player_id)
                     else:
                         return Action(type="check", player_id=player.player_id)
                 except Exception as e:
                     print(f"An error occurred processing input: {e}. Please try again.")
 
-    def notify_event(self, event: GameEvent, game_state: GameState) -> None:
+    def _print_action_help(self, possible_choices_display: list, allowed_actions: dict, player: 'Player', game_state: 'GameState', amount_to_call: int) -> None:
+        """Prints what each listed action does. Shown at the start of a normal-mode turn and on 'help'."""
+        print("------------------------------------------------------------")
+        print("Action explanations (type 'help' to show them again):")
+        if "fold" in possible_choices_display: print("- fold: Give up your hand")
+        if "check" in possible_choices_display: print("- check: Pass without betting (only when no bet to call)")
+        if "call" in possible_choices_display:
+            call_cost = min(player.stack, amount_to_call) # What player.place_bet will take on a call
+            print(f"- call: Match the current bet (costs {call_cost})")
+        if "bet <amount>" in possible_choices_display:
+            min_bet_val = allowed_actions["bet"].get("min", game_state.big_blind)
+            max_bet_val = allowed_actions["bet"].get("max", player.stack)
+            print(f"- bet <amount>: Make a bet (e.g., 'bet 50'). Min: {min_bet_val}, Max: {max_bet_val} (your stack)")
+        if "raise <total_amount>" in possible_choices_display:
+            min_raise_val = allowed_actions["raise"].get("min_total_bet", game_state.current_bet_to_match + game_state.big_blind)
+            max_raise_val = allowed_actions["raise"].get("max_total_bet", player.current_bet + player.stack)
+            print(f"- raise <total_amount>: Raise the current bet (e.g., 'raise 100'). Min total: {min_raise_val}, Max total: {max_raise_val} (all-in)")
+        print("------------------------------------------------------------")
+
+    def _handle_fold(self, player: 'Player', game_state: 'GameState', allowed_actions: dict, amount_to_call: int, rest: str) -> Optional[Action]:
+        if allowed_actions.get("fold"):
+            return Action(type="fold", player_id=player.player_id)
+        print("Action 'fold' is not allowed right now.") # Should not happen if listed
+        return None
+
+    def _handle_check(self, player: 'Player', game_state: 'GameState', allowed_actions: dict, amount_to_call: int, rest: str) -> Optional[Action]:
+        if allowed_actions.get("check") and amount_to_call <= 0:
+            return Action(type="check", player_id=player.player_id)
+        print("Action 'check' is not allowed (must call or bet is pending).")
+        return None
+
+    def _handle_call(self, player: 'Player', game_state: 'GameState', allowed_actions: dict, amount_to_call: int, rest: str) -> Optional[Action]:
+        if allowed_actions.get("call") and amount_to_call > 0:
+            # The amount in Action for call should be the amount_to_call for matching purposes,
+            # player.place_bet will handle if it's an all-in for less.
+            # The 'call' value in allowed_actions IS the correct amount player needs to put in.
+            return Action(type="call", amount=allowed_actions["call"], player_id=player.player_id)
+        print("Action 'call' is not allowed or nothing to call.")
+        return None
+
+    def _handle_bet(self, player: 'Player', game_state: 'GameState', allowed_actions: dict, amount_to_call: int, rest: str) -> Optional[Action]:
+        bet_details = allowed_actions.get("bet")
+        if not (bet_details and amount_to_call <= 0):
+            print("Action 'bet' is not allowed now (e.g. facing a bet).")
+            return None
+        if not rest:
+            print("Please specify bet amount (e.g., 'bet 50').")
+            return None
+        action_amount = self._parse_amount(rest)
+        if action_amount is None:
+            return None
+        min_bet_val = bet_details["min"]
+        max_bet_val = bet_details["max"]
+        if not (min_bet_val <= action_amount <= max_bet_val):
+            print(f"Invalid bet amount. Must be between {min_bet_val} and {max_bet_val}. Your stack: {player.stack}")
+            return None
+
+        if not self.confirm_actions or input(f"Confirm bet {action_amount} chips? (y/n): ").strip().lower() == 'y':
+            return Action(type="bet", amount=action_amount, player_id=player.player_id)
+        print("Bet cancelled.")
+        return None
+
+    def _handle_raise(self, player: 'Player', game_state: 'GameState', allowed_actions: dict, amount_to_call: int, rest: str) -> Optional[Action]:
+        raise_details = allowed_actions.get("raise")
+        if not (raise_details and amount_to_call > 0):
+            print("Action 'raise' is not allowed now (e.g. no prior bet to raise).")
+            return None
+        if not rest:
+            print("Please specify total amount for raise (e.g., 'raise 100').")
+            return None
+        action_amount = self._parse_amount(rest)
+        if action_amount is None:
+            return None
+        min_raise_total = raise_details["min_total_bet"]
+        max_raise_total = raise_details["max_total_bet"]
+
+        # action_amount is the TOTAL bet player wants to make for the round
+        if not (min_raise_total <= action_amount <= max_raise_total):
+            print(f"Invalid raise amount. Total bet must be between {min_raise_total} and {max_raise_total}. Your stack: {player.stack}")
+            return None
+
+        # This additional check from before seems correct to ensure it's a valid raise value.
+        if action_amount <= game_state.current_bet_to_match:
+            print(f"Must raise to more than current bet to match ({game_state.current_bet_to_match}).")
+            return None
+
+        if not self.confirm_actions or input(f"Confirm raise to total {action_amount} chips? (y/n): ").strip().lower() == 'y':
+            return Action(type="raise", amount=action_amount, player_id=player.player_id)
+        print("Raise cancelled.")
+        return None
+
+    def _handle_quit(self, player: 'Player', game_state: 'GameState', allowed_actions: dict, amount_to_call: int, rest: str) -> Optional[Action]:
+        confirm_quit = ""
+        try:
+            confirm_quit = input("Are you sure you want to quit the game? (y/n): ").strip().lower()
+        except EOFError:
+            print("\nEOFError during quit confirmation. Assuming 'n'.")
+            confirm_quit = "n" # Default to not quitting if input fails
+
+        if confirm_quit == 'y':
+            return Action(type="quit", player_id=player.player_id)
+        print("Quit cancelled.")
+        return None
+
+    def _parse_amount(self, rest: str) -> Optional[int]:
+        """Parses the amount typed after bet/raise. Prints an error and returns None if it is not a number."""
+        token = rest.split(' ', 1)[0]
+        if not token.isdecimal(): # Checked up front rather than catching int()'s ValueError
+            print("Invalid amount. Please enter a number for the amount.")
+            return None
+        return int(token)
+
+    def notify_event(self, event: 'GameEvent', game_state: 'GameState') -> None:
         # Simplified event notifications, as display_game_state will be the primary view.
         # Outputting key actions for a running log.
         # print(f"DEBUG [EVENT] {event.timestamp.strftime('%H:%M:%S')} - {event.type}: {event.data}") # Keep for debugging if needed
 
-        if event.type == "player_action":
-            player_id = event.data.get('player_id', 'UnknownPlayer')
-            action_type = event.data.get('action_type', 'unknown_action')
-            amount = event.data.get('amount', 0)
-
-            # The check for is_current_human_turn was causing NameError because current_player_id is not in scope here.
-            # For now, notify_event will print all actions. display_game_state is the primary view.
-            # If suppression of human's own action log is desired, current_player_id would need to be passed to notify_event.
-
-            if action_type == "small_blind":
-                print(f"{player_id} posts Small Blind ({amount})")
-            elif action_type == "big_blind":
-                print(f"{player_id} posts Big Blind ({amount})")
-            elif action_type == "fold":
-                print(f"{player_id} FOLDS")
-            elif action_type == "check":
-                print(f"{player_id} CHECKS")
-            elif action_type == "call":
-                print(f"{player_id} CALLS {amount}")
-            elif action_type == "bet":
-                print(f"{player_id} BETS {amount}")
-            elif action_type == "raise":
-                # The 'amount' for a raise action in GameEvent data is the total bet amount.
-                print(f"{player_id} RAISES to {amount}")
-            # else:
-                # print(f"{player_id} performs {action_type} {amount if amount else ''}") # Generic fallback
-
-        elif event.type == "community_cards_dealt":
-            # This will be visible in display_game_state. Can add a specific message if desired.
-            # print(f"--- {event.data.get('phase', '').upper()} --- Cards: {event.data.get('cards')}")
-            pass # display_game_state will show them
+        handler = self._EVENT_HANDLERS.get(event.type)
+        if handler:
+            handler(self, event, game_state)
 
         # Other event types can be handled here for specific logging/messages if needed.
         # e.g., "round_start", "phase_start" are now handled by dedicated display methods.
 
-    def display_game_state(self, game_state: GameState, current_player_id: Optional[str] = None, show_hole_cards_for_player: Optional[str] = None) -> None:
-        print("\n============================================================")
-        print(f"ROUND {game_state.round_number} - {game_state.game_phase.upper()}")
-        print("============================================================")
-
-        community_cards_str = " ".join(str(c) for c in game_state.community_cards) if game_state.community_cards else "None"
-        print(f"Community: [ {community_cards_str} ]")
+    def _on_player_action(self, event: 'GameEvent', game_state: 'GameState') -> None:
+        player_id = event.data.get('player_id', 'UnknownPlayer')
+        action_type = event.data.get('action_type', 'unknown_action')
+        amount = event.data.get('amount', 0)
+
+        # The check for is_current_human_turn was causing NameError because current_player_id is not in scope here.
+        # For now, notify_event will print all actions. display_game_state is the primary view.
+        # If suppression of human's own action log is desired, current_player_id would need to be passed to notify_event.
+
+        fmt = _ACTION_FMT.get(action_type)
+        if fmt:
+            print(fmt.format(pid=player_id, amt=amount))
+        # else:
+            # print(f"{player_id} performs {action_type} {amount if amount else ''}") # Generic fallback
+
+    def _on_community_cards_dealt(self, event: 'GameEvent', game_state: 'GameState') -> None:
+        # The new cards are shown by the next display_game_state; just drop the cached board text.
+        self._community_cards_str = None
+
+    # Event log dispatch for notify_event; event types without an entry are not printed.
+    _EVENT_HANDLERS = {
+        "player_action": _on_player_action,
+        "community_cards_dealt": _on_community_cards_dealt,
+    }
+
+    def display_game_state(self, game_state: 'GameState', current_player_id: Optional[str] = None, show_hole_cards_for_player: Optional[str] = None) -> None:
+        # Lines are collected and written in one call; the display methods below do the same.
+        out = []
+        out.append("\n============================================================")
+        out.append(f"ROUND {game_state.round_number} - {game_state.game_phase.upper()}")
+        out.append("============================================================")
+
+        if self._community_cards_str is None: # Reset by display_round_start and community_cards_dealt events
+            self._community_cards_str = " ".join(map(str, game_state.community_cards)) if game_state.community_cards else "None"
+        out.append(f"Community: [ {self._community_cards_str} ]")
 
         # Display Human Player's cards prominently if they are in the game
         human_player_obj = None
         for p_obj in game_state.players:
-            if isinstance(p_obj, HumanPlayer):
+            if p_obj.kind == KIND_HUMAN:
                 human_player_obj = p_obj
                 break
 
@@ -260,101 +357,75 @@ class ConsoleInterface(GameInterface):
             # This implies it's from the human player's perspective.
             # So, only if current_player_id is the human, or if show_hole_cards_for_player is the human.
             # The most straightforward way is to always show it if the HumanPlayer has cards and is not folded.
-             print(f"🂡 Your cards: {' '.join(str(c) for c in human_player_obj.hole_cards)}")
+             out.append(f"🂡 Your cards: {' '.join(map(str, human_player_obj.hole_cards))}")
 
         total_pot_display = game_state.pot_size + game_state.current_round_pot
-        print(f"💰 Pot: {total_pot_display} chips")
+        out.append(f"💰 Pot: {total_pot_display} chips")
 
         # Current bet to match for the street (not player's individual current bet for the street)
         # game_state.current_bet_to_match is the highest total bet made by a player on this street.
         # A player needs to at least match this to stay in.
         # "Current bet" in the UI example likely means "bet to call".
-        bet_to_call = 0
-        if current_player_id:
-            player_obj = game_state.get_player_by_id(current_player_id)
-            if player_obj:
-                bet_to_call = game_state.current_bet_to_match - player_obj.current_bet
-
         # If no current player, current_bet_to_match is the general high bet.
         # The example "🎯 Current bet: 20" implies the highest bet on the table this round.
-        print(f"🎯 Current total bet to match: {game_state.current_bet_to_match}")
-        print("\nPlayers:")
+        out.append(f"🎯 Current total bet to match: {game_state.current_bet_to_match}")
+        out.append("\nPlayers:")
 
         dealer_player_id = game_state.players[game_state.dealer_button_position].player_id
+        # Role markers only apply to up to three players, so resolve them once instead of per player.
+        role_by_id = {dealer_player_id: "D"}
+        for role_player_id, marker in ((game_state.small_blind_player_id, "SB"), (game_state.big_blind_player_id, "BB")):
+            role_by_id[role_player_id] = f"{role_by_id[role_player_id]}, {marker}" if role_player_id in role_by_id else marker
 
         for p in game_state.players:
-            if p.stack == 0 and not p.is_all_in and not p.is_folded and p.current_bet == 0 : # Truly out of game, skip display
-                # This condition might need refinement if players can be 0 stack but still all-in from previous street
-                # For now, if stack is 0 and they are not part of current action, they are "out".
-                # A better way is to filter players for display based on if they played this game round or are still in.
-                # For now, let's show all players from game_state.players and mark their status.
-                pass
-
-
-            prefix = ">>> " if p.player_id == current_player_id else "    "
-
-            role_markers = []
-            if p.player_id == dealer_player_id:
-                role_markers.append("D")
-            if p.player_id == game_state.small_blind_player_id:
-                role_markers.append("SB")
-            if p.player_id == game_state.big_blind_player_id:
-                role_markers.append("BB")
-            role_str = f" [{', '.join(role_markers)}]" if role_markers else ""
-
-            status_parts = []
-            if p.current_bet > 0:
-                status_parts.append(f"bet: {p.current_bet}")
-            if p.is_folded:
-                status_parts.append("FOLDED")
-            elif p.is_all_in: # Don't show "bet: X" if all-in, as stack is 0. current_bet is their total commitment.
-                status_parts.append("ALL-IN")
-                # Remove "bet: X" if already added and player is all-in, to avoid redundancy.
-                if f"bet: {p.current_bet}" in status_parts and p.stack == 0 :
-                    idx_to_remove = -1
-                    for i, part in enumerate(status_parts):
-                        if part.startswith("bet:"):
-                            idx_to_remove = i
-                            break
-                    if idx_to_remove != -1 : status_parts.pop(idx_to_remove)
-
-
-            status_str = f" ({', '.join(status_parts)})" if status_parts else ""
-
-            player_line = f"{prefix}{p.player_id}: {p.stack} chips{role_str}{status_str}"
-            print(player_line)
-
-            if p.player_id == show_hole_cards_for_player and p.hole_cards: # Current human player's turn
-                 print(f"    🎴 Your cards: {' '.join(str(c) for c in p.hole_cards)}")
-            elif game_state.game_phase == "showdown" and not p.is_folded and p.hole_cards: # Showdown phase
-                 print(f"    Cards: {' '.join(str(c) for c in p.hole_cards)}")
+            pid, stack, bet = p.player_id, p.stack, p.current_bet
+            folded, all_in, holes = p.is_folded, p.is_all_in, p.hole_cards
+
+            prefix = ">>> " if pid == current_player_id else "    "
+
+            role = role_by_id.get(pid)
+            role_str = f" [{role}]" if role else ""
+
+            if folded:
+                status_str = f" (bet: {bet}, FOLDED)" if bet > 0 else " (FOLDED)"
+            elif all_in: # Don't show "bet: X" once the stack is empty, current_bet is their total commitment.
+                status_str = f" (bet: {bet}, ALL-IN)" if bet > 0 and stack > 0 else " (ALL-IN)"
+            elif bet > 0:
+                status_str = f" (bet: {bet})"
+            else:
+                status_str = ""
+
+            out.append(f"{prefix}{pid}: {stack} chips{role_str}{status_str}")
+
+            if pid == show_hole_cards_for_player and holes: # Current human player's turn
+                 out.append(f"    🎴 Your cards: {' '.join(map(str, holes))}")
+            elif game_state.game_phase == "showdown" and not folded and holes: # Showdown phase
+                 out.append(f"    Cards: {' '.join(map(str, holes))}")
             # Optionally, for non-current players during non-showdown, show [X X] if you want to indicate they have cards
             # elif p.hole_cards and not p.is_folded :
             #    print(f"    Cards: [X X]")
 
 
-        print("------------------------------------------------------------")
+        out.append("------------------------------------------------------------")
+        sys.stdout.write("\n".join(out) + "\n")
 
-    def display_round_start(self, game_state: GameState, round_number: int) -> None:
-        print(f"\n--- Starting Round {round_number} ---")
-        print("==================================================")
-        print(f"STARTING ROUND {round_number}")
-        print("==================================================")
+    def display_round_start(self, game_state: 'GameState', round_number: int) -> None:
+        self._community_cards_str = None # Community cards are reset for the new round
+        sys.stdout.write(_ROUND_START.format(round_number=round_number))
         # Dealer button display can be part of display_game_state for context
         # Blinds posting messages will come from notify_event for player actions.
         # No longer need to calculate/display SB/BB posters here as GameState will have them for display_game_state.
 
-    def display_player_cards(self, player: Player) -> None:
-        if isinstance(player, HumanPlayer): # Only show for human players via this direct call
+    def display_player_cards(self, player: 'Player') -> None:
+        if player.kind == KIND_HUMAN: # Only show for human players via this direct call
             print(f"Your cards, {player.player_id}: {[str(c) for c in player.hole_cards] if player.hole_cards else 'None'}")
 
-    def display_winner(self, winners_data: list, game_state: GameState, hand_results: dict) -> None:
-        print("\n🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉")
-        print("HAND RESULTS")
-        print("🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉🎉")
+    def display_winner(self, winners_data: list, game_state: 'GameState', hand_results: dict) -> None:
+        _write_preencoded(_WIN_HEADER, _WIN_HEADER_UTF8)
+        out = []
 
         if not winners_data:
-            print("No winners determined (e.g., all folded before showdown).")
+            out.append("No winners determined (e.g., all folded before showdown).")
         else:
             for winner_info in winners_data:
                 player_id = winner_info["player_id"]
@@ -365,32 +436,35 @@ class ConsoleInterface(GameInterface):
                 player = game_state.get_player_by_id(player_id)
                 player_display_name = player.player_id if player else player_id
 
-                print(f"🏆 Winner: {player_display_name}")
+                out.append(f"🏆 Winner: {player_display_name}")
                 if hand_name and hand_name != " uncontested_pot": # Don't show "Unknown Hand" or "uncontested" as hand type here
-                    print(f"🃏 Hand: {hand_name} ({' '.join(str(c) for c in best_cards)})")
-                print(f"💰 Winnings: {amount_won} chips")
+                    out.append(f"🃏 Hand: {hand_name} ({' '.join(map(str, best_cards))})")
+                out.append(f"💰 Winnings: {amount_won} chips")
                 if player and player.hole_cards and hand_name != " uncontested_pot": # Show winner's hole cards if they had a showdown
-                    print(f"   {player_display_name}'s hole cards: {' '.join(str(c) for c in player.hole_cards)}")
-                print("------------------------------------------------------------")
-
-        # Display all hands at showdown, including losers
-        if game_state.game_phase == "showdown" and len(winners_data) > 0 and winners_data[0].get("hand_name") != " uncontested_pot":
-            print("\nShowdown Hands:")
+                    out.append(f"   {player_display_name}'s hole cards: {' '.join(map(str, player.hole_cards))}")
+                out.append("------------------------------------------------------------")
+
+        # Display all hands at showdown, including losers. Skipped when every showdown hand won,
+        # since the winner block above already shows their hands and hole cards.
+        winner_ids = {w_data["player_id"] for w_data in winners_data}
+        if game_state.game_phase == "showdown" and len(winners_data) > 0 and winners_data[0].get("hand_name") != " uncontested_pot" \
+                and len(hand_results) > len(winner_ids):
+            out.append("\nShowdown Hands:")
             # Iterate through players who were part of the showdown (not folded)
             # hand_results dict is {player_id: {'hand_name': ..., 'best_cards': ..., ...}}
             for p_id, result in hand_results.items():
                 player_obj = game_state.get_player_by_id(p_id)
                 if player_obj and not player_obj.is_folded and player_obj.hole_cards: # Ensure player was in showdown
-                    is_a_winner = any(w_data["player_id"] == p_id for w_data in winners_data)
-                    win_indicator = " (Winner)" if is_a_winner else ""
+                    win_indicator = " (Winner)" if p_id in winner_ids else ""
 
                     # Only print if it's not the main winner already detailed above, or to add their hole cards if not shown
                     # This logic can be tricky to avoid duplicate display.
                     # Alternative: always list all showdown hands clearly.
-                    print(f"  {player_obj.player_id}{win_indicator}:")
-                    print(f"    Hole: {' '.join(str(c) for c in player_obj.hole_cards)}")
-                    print(f"    Best Hand: {result['hand_name']} ({' '.join(str(c) for c in result['best_cards'])})")
-            print("------------------------------------------------------------")
+                    out.append(f"  {player_obj.player_id}{win_indicator}:")
+                    out.append(f"    Hole: {' '.join(map(str, player_obj.hole_cards))}")
+                    out.append(f"    Best Hand: {result['hand_name']} ({' '.join(map(str, result['best_cards']))})")
+            out.append("------------------------------------------------------------")
+        sys.stdout.write("\n".join(out) + "\n")
 
         if self.game_mode == "normal":
             try:
@@ -404,13 +478,13 @@ class ConsoleInterface(GameInterface):
     def get_player_names(self, num_players: int) -> list[str]:
         names = []
         for i in range(num_players):
+            prompt = _NAME_PROMPT + str(i + 1) + ": " # Built once per player, reused on re-prompts
             while True:
-                name = input(f"Enter name for Human Player {i+1}: ").strip()
+                name = input(prompt).strip()
                 if name:
                     names.append(name)
                     break
-                else:
-                    print("Name cannot be empty.")
+                print("Name cannot be empty.")
         return names
 
     def show_message(self, message: str) -> None:
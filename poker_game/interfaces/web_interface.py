@@ -1,11 +1,18 @@
 from poker_game.interfaces.base_interface import GameInterface
-from poker_game.core.player import Player, HumanPlayer
+from poker_game.core.player import Player, KIND_HUMAN
 from poker_game.core.game_state import GameState
 from poker_game.core.events import Action, GameEvent
-from poker_game.core.cards import Card # For type hinting Card objects
-from typing import TYPE_CHECKING, Dict, Any, Optional, List
-import queue # Thread-safe queue for actions from web to game engine
+from poker_game.core.cards import CARD_JSON
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple
 import logging # For logging
+import threading
+import collections
+import json
+
+try:
+    import orjson # Optional, much faster encoder for the Socket.IO packets
+except ImportError:
+    orjson = None
 
 if TYPE_CHECKING:
     from flask_socketio import SocketIO
@@ -13,20 +20,178 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+class SocketIOJSON:
+    """
+    JSON module for SocketIO(json=...). Each emitted payload is encoded exactly once into the packet
+    that python-socketio reuses for every recipient; orjson makes that single encode cheap.
+    """
+    if orjson is not None:
+        @staticmethod
+        def dumps(obj: Any, **kwargs) -> str: # Output is always compact, separators are ignored
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+        loads = staticmethod(orjson.loads)
+    else:
+        dumps = staticmethod(json.dumps)
+        loads = staticmethod(json.loads)
+
+_HIDDEN_HOLE_CARDS = ["HIDDEN", "HIDDEN"] # Placeholder for hidden cards; shared, never mutate
+
+_FULL_UPDATE_EVERY = 20 # Deltas sent before a full game_update resyncs the clients anyway
+
+class _DeltaStream:
+    """Delta bookkeeping for one audience: the state it was last sent and when a full update is due."""
+    __slots__ = ("base", "deltas_since_full", "force_full")
+
+    def __init__(self):
+        self.base: Optional[Dict[str, Any]] = None
+        self.deltas_since_full = 0
+        self.force_full = False
+
+    def next_message(self, state: Dict[str, Any], event: Optional[Dict[str, Any]]) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Returns the (event_name, payload) that brings this audience to 'state': a full 'game_update',
+        or a 'game_update_delta' holding only the top-level fields and players that changed.
+        Full updates go out on phase changes, every _FULL_UPDATE_EVERY deltas and on request.
+        Returns None when the audience already has this state and there is no event to deliver.
+        """
+        base = self.base
+        if (base is None or self.force_full or self.deltas_since_full >= _FULL_UPDATE_EVERY
+                or state.get("game_phase") != base.get("game_phase")
+                or len(state.get("players", ())) != len(base.get("players", ()))):
+            self.force_full = False
+            self.deltas_since_full = 0
+            self.base = state
+            payload = {"game_state": state}
+            if event is not None:
+                payload["event"] = event
+            return 'game_update', payload
+
+        state_delta: Dict[str, Any] = {}
+        players_delta: List[Dict[str, Any]] = []
+        if state != base: # One C-level compare skips the per-field walk when nothing changed
+            for key, value in state.items():
+                if key != "players" and base.get(key) != value:
+                    state_delta[key] = value
+            for index, (new_p, old_p) in enumerate(zip(state["players"], base["players"])):
+                if new_p != old_p:
+                    players_delta.append({"index": index,
+                                          "changes": {k: v for k, v in new_p.items() if old_p.get(k) != v}})
+        if not state_delta and not players_delta and event is None:
+            return None
+        self.base = state
+        self.deltas_since_full += 1
+        payload = {"state_delta": state_delta, "players_delta": players_delta}
+        if event is not None:
+            payload["event"] = event
+        return 'game_update_delta', payload
+
 class WebInterface(GameInterface):
-    def __init__(self, socketio_instance: 'SocketIO', action_queue: queue.Queue, human_player_id_for_view: str):
+    def __init__(self, socketio_instance: 'SocketIO', human_player_id_for_view: str):
         self.socketio = socketio_instance
-        self.action_queue = action_queue
         self.human_player_id = human_player_id_for_view
+        # Single-slot hand-off for the one action request in flight: submit_action fills the slot and sets the Event
+        self._action_ready = threading.Event()
+        self._pending_action: Optional[Action] = None
+        self._awaiting_player_id: Optional[str] = None
+        # Outgoing emits are queued and sent by one background thread so the engine thread never blocks on I/O.
+        # Producers are the engine and the socket handlers (send_sync); deque append/popleft are atomic and
+        # the Event only wakes the single consumer.
+        self._emit_q: collections.deque = collections.deque()
+        self._emit_ready = threading.Event()
+        self._closed = False # Set by close(); the emitter flushes what is queued and exits
+        self._emit_seq = 0 # Unique coalesce keys for messages that must all be delivered; engine thread only
+        self._sid_by_player: Dict[str, str] = {} # player_id -> Socket.IO session id, for private messages
+        self._round_game_state: Optional[GameState] = None # display_player_cards gets no state of its own
+        # State updates go out as two views: the public one (no hole cards but showdown hands) to every
+        # client except the human's socket, and the human's own view only to that socket.
+        self._public_stream = _DeltaStream()
+        self._human_stream = _DeltaStream()
+        # Guards the delta streams above and orders state snapshots with their enqueue, across the engine
+        # thread and socket handlers, so no delta computed from an older snapshot is queued after a sync
+        self._state_lock = threading.Lock()
+        self._emitter = self.socketio.start_background_task(self._emit_loop) # Green thread under eventlet
         # self.game_engine: Optional['GameEngine'] = None
         logger.info("WebInterface initialized.")
 
     # def set_game_engine(self, game_engine: 'GameEngine'):
     #     self.game_engine = game_engine
 
-    def _card_to_str_dict(self, card: Card) -> Dict[str, str]:
-        """Converts a Card object to a dict {'rank': 'X', 'suit': 'Y'} for JSON."""
-        return {"rank": card.rank, "suit": card.suit}
+    def register_sid(self, player_id: str, sid: str) -> None:
+        """Associates a client session with a player so private messages go only to that socket."""
+        self._sid_by_player[player_id] = sid
+        logger.info(f"WebInterface: Registered sid {sid} for player {player_id}")
+
+    def unregister_sid(self, sid: str) -> None:
+        for player_id, registered_sid in list(self._sid_by_player.items()):
+            if registered_sid == sid:
+                del self._sid_by_player[player_id]
+
+    def send_sync(self, sid: str, game_state: GameState, action_request: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Queues a 'sync' message (full state plus the pending action request, if any) for one client.
+        The human's registered socket gets the human's view and the request; any other client gets the
+        public view only. It goes through the emit queue so it is delivered after any deltas already
+        queued, which were computed against an older base and would otherwise overwrite the synced state.
+        """
+        with self._state_lock:
+            if self._sid_by_player.get(self.human_player_id) == sid:
+                state = self._game_state_to_json(game_state, self.human_player_id)
+                self._human_stream.force_full = True # Later deltas must not assume an older base for this client
+            else:
+                state = self._game_state_to_json(game_state, None)
+                self._public_stream.force_full = True
+                action_request = None
+            self._emit('sync', {'game_state': state, 'request': action_request}, coalesce_key=('sync', sid), to=sid)
+
+    def submit_action(self, action: Action) -> bool:
+        """
+        Hands an action from the web client to the engine thread waiting in get_player_action.
+        Returns False if no action is currently being awaited from that player.
+        """
+        if action.player_id != self._awaiting_player_id or self._action_ready.is_set():
+            return False # Not this player's turn, or the pending request already has its action
+        self._pending_action = action
+        self._action_ready.set()
+        return True
+
+    def _emit(self, event_name: str, payload: Dict[str, Any], coalesce_key: Optional[str] = None,
+              to: Optional[str] = None, skip_sid: Optional[str] = None) -> None:
+        """
+        Queues an emit for the background emitter. Messages sharing a coalesce_key that are still
+        pending get collapsed to the latest one; without a key the message is always delivered.
+        'to' is a client sid for targeted sends; None broadcasts, leaving out 'skip_sid' if given.
+        """
+        if coalesce_key is None:
+            self._emit_seq += 1
+            coalesce_key = self._emit_seq
+        self._emit_q.append((event_name, payload, coalesce_key, to, skip_sid))
+        self._emit_ready.set()
+
+    def close(self) -> None:
+        """Stops the background emitter once it has sent everything already queued. Call when the game ends."""
+        self._closed = True
+        self._emit_ready.set()
+
+    def _emit_loop(self) -> None:
+        emit_q = self._emit_q
+        emit_ready = self._emit_ready
+        while True:
+            emit_ready.wait()
+            emit_ready.clear() # Before draining, so an append racing the drain still wakes the next pass
+            batch = {}
+            while emit_q:
+                item = emit_q.popleft()
+                batch.pop(item[2], None) # Re-insert so a collapsed message keeps its latest position
+                batch[item[2]] = item
+            for event_name, payload, _, to, skip_sid in batch.values():
+                try:
+                    self.socketio.emit(event_name, payload, to=to, skip_sid=skip_sid, namespace='/') # No per-call namespace resolution
+                except Exception as e:
+                    logger.error(f"WebInterface: Error emitting '{event_name}': {e}")
+            if self._closed and not emit_q:
+                return
+            self.socketio.sleep(0) # Yield between flushes
 
     def _game_state_to_json(self, game_state: GameState, perspective_player_id: Optional[str] = None) -> Dict[str, Any]:
         """Converts GameState to a JSON-serializable dict for web clients."""
@@ -34,45 +199,50 @@ class WebInterface(GameInterface):
             logger.warning("Attempted to serialize a None game_state.")
             return {}
 
-        players_data = []
-        for p in game_state.players:
-            player_dict = {
+        # Loop invariants hoisted out of the per-player build
+        players = game_state.players
+        dealer_id = players[game_state.dealer_button_position].player_id if players else None
+        sb_id = game_state.small_blind_player_id
+        bb_id = game_state.big_blind_player_id
+        show_all_cards = game_state.game_phase == "showdown"
+        card_json = CARD_JSON
+
+        players_data = [
+            {
                 "player_id": p.player_id,
                 "stack": p.stack,
                 "current_bet": p.current_bet, # Bet amount for the current street
                 "is_folded": p.is_folded,
                 "is_all_in": p.is_all_in,
-                "is_human": isinstance(p, HumanPlayer), # Could be used by JS to identify the human
-                "is_dealer": game_state.players[game_state.dealer_button_position].player_id == p.player_id,
-                "is_sb": game_state.small_blind_player_id == p.player_id,
-                "is_bb": game_state.big_blind_player_id == p.player_id,
-                "hole_cards": None,
+                "is_human": p.kind == KIND_HUMAN, # Could be used by JS to identify the human
+                "is_dealer": p.player_id == dealer_id,
+                "is_sb": p.player_id == sb_id,
+                "is_bb": p.player_id == bb_id,
+                # Card visibility: own cards and showdown hands are shown, other live hands are hidden
+                "hole_cards": (
+                    [card_json[card] for card in p.hole_cards]
+                    if p.hole_cards and (p.player_id == perspective_player_id or (show_all_cards and not p.is_folded))
+                    else _HIDDEN_HOLE_CARDS if p.hole_cards and not p.is_folded
+                    else None
+                ),
             }
-            # Determine card visibility
-            if p.player_id == perspective_player_id and p.hole_cards:
-                player_dict["hole_cards"] = [self._card_to_str_dict(card) for card in p.hole_cards]
-            elif game_state.game_phase == "showdown" and not p.is_folded and p.hole_cards:
-                player_dict["hole_cards"] = [self._card_to_str_dict(card) for card in p.hole_cards]
-            elif p.hole_cards and not p.is_folded:
-                 player_dict["hole_cards"] = ["HIDDEN", "HIDDEN"] # Placeholder for hidden cards
-
-            players_data.append(player_dict)
-
-        current_player_obj = game_state.players[game_state.current_player_turn_index] if game_state.players and 0 <= game_state.current_player_turn_index < len(game_state.players) else None
-        current_player_turn_id_val = current_player_obj.player_id if current_player_obj else None
+            for p in players
+        ]
 
+        turn_index = game_state.current_player_turn_index
+        current_player_turn_id_val = players[turn_index].player_id if 0 <= turn_index < len(players) else None
 
         return {
             "players": players_data,
-            "community_cards": [self._card_to_str_dict(card) for card in game_state.community_cards] if game_state.community_cards else [],
+            "community_cards": [card_json[card] for card in game_state.community_cards],
             "pot_size": game_state.pot_size + game_state.current_round_pot,
             "current_bet_to_match": game_state.current_bet_to_match,
             "game_phase": game_state.game_phase,
             "round_number": game_state.round_number,
             "current_player_turn_id": current_player_turn_id_val,
-            "dealer_button_player_id": game_state.players[game_state.dealer_button_position].player_id if game_state.players else None,
-            "small_blind_player_id": game_state.small_blind_player_id,
-            "big_blind_player_id": game_state.big_blind_player_id,
+            "dealer_button_player_id": dealer_id,
+            "small_blind_player_id": sb_id,
+            "big_blind_player_id": bb_id,
             "is_game_over": game_state.is_game_over,
             # "game_over_reason": getattr(game_state, 'game_over_reason', None) # If you add this to GameState
         }
@@ -80,7 +250,7 @@ class WebInterface(GameInterface):
     def get_player_action(self, player: Player, game_state: GameState, allowed_actions: dict) -> Action:
         logger.info(f"WebInterface: Requesting action for {player.player_id}")
 
-        if not isinstance(player, HumanPlayer):
+        if player.kind != KIND_HUMAN:
             # This should ideally not be called for bots by the GameEngine if engine directly calls bot.make_decision()
             logger.warning(f"WebInterface.get_player_action called for Bot {player.player_id}. Bots should decide internally. Auto-folding.")
             return Action(type="fold", player_id=player.player_id)
@@ -93,41 +263,54 @@ class WebInterface(GameInterface):
         payload = {
             "player_id_to_act": player.player_id, # Whose turn it is
             "allowed_actions": allowed_actions,
-            "game_state_for_player": self._game_state_to_json(game_state, player.player_id) # State from this player's perspective
         }
-
-        # Emit to a specific client or all and let client filter.
-        # For MVP with one human, emitting to all and letting JS check player_id might be simpler than managing SIDs for rooms.
-        # However, 'request_player_action' should ideally target only the specific player.
-        # This requires mapping player_id to a client's session ID (sid) on connect.
-        # For now, let's assume JS will filter based on player_id_to_act matching its own ID.
+        # Target the player's own socket (registered on connect), with their view of the state (their hole cards).
+        # If no client has registered yet, broadcast the request without it; JS filters by player_id_to_act.
+        player_sid = self._sid_by_player.get(player.player_id)
+        if player_sid is not None:
+            payload["game_state_for_player"] = self._game_state_to_json(game_state, player.player_id)
+
+        # Arm the slot before emitting so a fast reply cannot arrive before it is accepted
+        self._pending_action = None
+        self._action_ready.clear()
+        self._awaiting_player_id = player.player_id
         logger.info(f"WebInterface: Emitting 'request_player_action' for {player.player_id} with payload: {payload}")
-        self.socketio.emit('request_player_action', payload)
+        self._emit('request_player_action', payload, to=player_sid)
 
         try:
-            # Block and wait for the action from the web client
-            # The web route (/submit_action) will put the Action object onto this queue
-            action = self.action_queue.get(timeout=120) # 2 minute timeout
-            logger.info(f"WebInterface: Received action from queue for {player.player_id}: {action}")
-            if action.player_id != player.player_id:
-                logger.error(f"Action received for wrong player! Expected {player.player_id}, got {action.player_id}. Auto-folding.")
+            # Block until the web route (/submit_action) delivers the action through submit_action()
+            if not self._action_ready.wait(120): # 2 minute timeout
+                logger.warning(f"WebInterface: Timeout waiting for action from {player.player_id}. Auto-folding.")
                 return Action(type="fold", player_id=player.player_id)
+            action = self._pending_action
+            logger.info(f"WebInterface: Received action for {player.player_id}: {action}")
             return action
-        except queue.Empty:
-            logger.warning(f"WebInterface: Timeout waiting for action from {player.player_id}. Auto-folding.")
-            return Action(type="fold", player_id=player.player_id)
         except Exception as e:
-            logger.error(f"WebInterface: Error getting action from queue for {player.player_id}: {e}. Auto-folding.")
+            logger.error(f"WebInterface: Error waiting for action from {player.player_id}: {e}. Auto-folding.")
             return Action(type="fold", player_id=player.player_id)
-
+        finally:
+            self._awaiting_player_id = None
+            self._pending_action = None
+
+
+    def _broadcast_state(self, game_state: GameState, event: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Sends the public view of the state to every client but the human's socket, and the human's own
+        view to that socket, each as a full 'game_update' or a 'game_update_delta' (see _DeltaStream).
+        """
+        with self._state_lock:
+            human_sid = self._sid_by_player.get(self.human_player_id)
+            message = self._public_stream.next_message(self._game_state_to_json(game_state, None), event)
+            if message is not None:
+                self._emit(*message, skip_sid=human_sid)
+            if human_sid is not None:
+                message = self._human_stream.next_message(self._game_state_to_json(game_state, self.human_player_id), event)
+                if message is not None:
+                    self._emit(*message, to=human_sid)
 
     def notify_event(self, event: GameEvent, game_state: GameState) -> None:
         # logger.debug(f"WebInterface: Notifying event {event.type} to clients.")
-        game_update_payload = {
-            "event": {"type": event.type, "data": event.data},
-            "game_state": self._game_state_to_json(game_state, self.human_player_id)
-        }
-        self.socketio.emit('game_update', game_update_payload)
+        self._broadcast_state(game_state, {"type": event.type, "data": event.data})
         # logger.debug("WebInterface: 'game_update' emitted.")
 
 
@@ -135,56 +318,65 @@ class WebInterface(GameInterface):
         # This is called by GameEngine. For Web, the main update is via notify_event.
         # This can serve as an additional explicit state push if needed.
         # logger.debug(f"WebInterface: display_game_state called (current: {current_player_id}). Triggering game_update.")
-        game_update_payload = {
-            "game_state": self._game_state_to_json(game_state, self.human_player_id) # Perspective of the human user
-        }
-        self.socketio.emit('game_update', game_update_payload)
+        # Perspective of the human user. Usually nothing changed since the last event, so nothing is sent.
+        self._broadcast_state(game_state)
 
     def display_round_start(self, game_state: GameState, round_number: int) -> None:
         # logger.info(f"WebInterface: Displaying round start for round {round_number}")
         # This info is part of game_state. A specific banner event can be nice.
-        self.socketio.emit('round_start_banner', {'round_number': round_number,
-                                                 'message': f"--- STARTING ROUND {round_number} ---"})
+        self._round_game_state = game_state
+        self._emit('round_start_banner', {'round_number': round_number}) # The client renders the banner text
 
 
     def display_player_cards(self, player: Player) -> None:
         # This is mainly for the human player.
         # The game_state update (with perspective) should generally handle this.
         # However, an explicit emit to a specific player might be useful if their cards change mid-update.
-        if isinstance(player, HumanPlayer) and player.player_id == self.human_player_id and player.hole_cards:
+        if player.kind == KIND_HUMAN and player.player_id == self.human_player_id and player.hole_cards:
             # logger.debug(f"WebInterface: Emitting 'player_cards_update' for {player.player_id}")
-            # This emit should ideally target only this specific player's client session.
-            # For now, emitting to all; JS should filter.
-            self.socketio.emit('game_update', {
-                "game_state": self._game_state_to_json(player.game_state_view, self.human_player_id) # Assuming player has a view of gamestate
-            }) # Send a full game update, JS will re-render player area
+            # Sent only to this player's client session; without one there is nobody to show the cards to.
+            with self._state_lock:
+                player_sid = self._sid_by_player.get(player.player_id)
+                if player_sid is None:
+                    return
+                self._emit('game_update', {
+                    "game_state": self._game_state_to_json(self._round_game_state, self.human_player_id) # State of the round being dealt
+                }, coalesce_key="player_cards", to=player_sid) # Send a full game update, JS will re-render player area
+                self._human_stream.force_full = True # This client's state moved past its delta base
 
     def display_winner(self, winners_data: list, game_state: GameState, hand_results: dict) -> None:
         # logger.info(f"WebInterface: Displaying winner. Winners: {len(winners_data)}")
 
+        # Card dicts come from the shared CARD_JSON table; winner dicts are only rebuilt when they hold cards
+        card_json = CARD_JSON
         # Prepare hand_results with stringified cards for JSON
-        json_hand_results = {}
-        if hand_results:
-            for pid, res_data in hand_results.items():
-                json_hand_results[pid] = {
-                    "hand_name": res_data["hand_name"],
-                    "best_cards": [self._card_to_str_dict(c) for c in res_data["best_cards"]] if res_data.get("best_cards") else []
-                }
+        json_hand_results = {
+            pid: {
+                "hand_name": res_data["hand_name"],
+                "best_cards": [card_json[c] for c in res_data["best_cards"]] if res_data.get("best_cards") else [],
+            }
+            for pid, res_data in hand_results.items()
+        } if hand_results else {}
 
         # Prepare winners_data with stringified cards
-        json_winners_data = []
-        for wd in winners_data:
-            json_wd = wd.copy()
-            if "best_cards" in json_wd and json_wd["best_cards"]:
-                json_wd["best_cards"] = [self._card_to_str_dict(c) for c in json_wd["best_cards"]]
-            json_winners_data.append(json_wd)
-
-        results_payload = {
+        json_winners_data = [
+            {**wd, "best_cards": [card_json[c] for c in wd["best_cards"]]} if wd.get("best_cards") else wd
+            for wd in winners_data
+        ]
+
+        # State after pot distribution: the public view for everyone, the human's own view for their socket
+        human_sid = self._sid_by_player.get(self.human_player_id)
+        self._emit('round_results', {
             "winners_data": json_winners_data,
             "hand_results": json_hand_results,
-            "game_state_after_win": self._game_state_to_json(game_state, self.human_player_id) # State after pot distribution
-        }
-        self.socketio.emit('round_results', results_payload)
+            "game_state_after_win": self._game_state_to_json(game_state, None)
+        }, skip_sid=human_sid)
+        if human_sid is not None:
+            self._emit('round_results', {
+                "winners_data": json_winners_data,
+                "hand_results": json_hand_results,
+                "game_state_after_win": self._game_state_to_json(game_state, self.human_player_id)
+            }, to=human_sid)
 
 
     def get_player_names(self, num_players: int) -> List[str]:
@@ -196,6 +388,4 @@ class WebInterface(GameInterface):
 
     def show_message(self, message: str) -> None:
         logger.info(f"WebInterface: show_message: {message}")
-        self.socketio.emit('show_message', {'message': message})
-
-```
+        self._emit('show_message', {'message': message})
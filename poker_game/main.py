@@ -1,11 +1,7 @@
 import argparse # Added for command-line arguments
-from poker_game.core.game_engine import GameEngine
-from poker_game.core.player import HumanPlayer
-from poker_game.core.bot_player import RandomBot, TightBot, AggressiveBot # Import available bot types
-from poker_game.core.events import EventSystem
-from poker_game.interfaces.console_interface import ConsoleInterface
-from poker_game.storage.memory_storage import MemoryRepository
 from poker_game.config import settings
+# Game, bot and interface modules are imported inside main() once the mode is known,
+# so web mode never loads the console stack and console modes never load Flask-SocketIO.
 
 def main():
     parser = argparse.ArgumentParser(description="Run the Poker Game.")
@@ -24,21 +20,21 @@ def main():
         # Import web_server and run it.
         # Ensure web_server.py can be run as a module or its app can be imported and run.
         try:
-            from web_server import app, socketio # Assuming app and socketio are defined in web_server.py
+            from web_server import run_server # Same startup path (debug gate, server choice) as running web_server.py
             print("Starting Flask-SocketIO server for web interface on http://localhost:5000")
-            # The web_server.py's __main__ block usually handles the socketio.run or app.run
-            # If importing, you might need to call socketio.run(app, ...) here,
-            # or structure web_server.py to have a start_server() function.
-            # For now, let's assume running web_server.py directly is the way for web mode.
-            # This main.py might just delegate to it.
-            # For a simple integrated start:
-            socketio.run(app, host='0.0.0.0', port=5000, debug=True, use_reloader=False)
+            run_server()
         except ImportError:
             print("Could not import web_server. Make sure it's in the project root and Flask/SocketIO are installed.")
         except Exception as e:
             print(f"Error starting web server: {e}")
         return # Exit main.py after attempting to start web server
 
+    from poker_game.core.game_engine import GameEngine
+    from poker_game.core.player import HumanPlayer
+    from poker_game.core.events import EventSystem
+    from poker_game.interfaces.console_interface import ConsoleInterface
+    from poker_game.storage.memory_storage import MemoryRepository
+
     print(f"Welcome to Console Poker! (Mode: {game_mode})")
 
     # Setup components for console modes
@@ -65,6 +61,7 @@ def main():
     players.append(human_player)
 
     # Add Bot players based on settings
+    from poker_game.core.bot_player import RandomBot, TightBot, AggressiveBot # Import available bot types
     bot_constructors = {
         "RandomBot": RandomBot,
         "TightBot": TightBot,
@@ -1,6 +1,6 @@
 document.addEventListener('DOMContentLoaded', () => {
-    const socket = io(); // Connect to Socket.IO server
     const myPlayerId = document.getElementById('my-player-id').textContent;
+    const socket = io({ query: { player_id: myPlayerId } }); // Connect to Socket.IO server; lets it target our socket
 
     // DOM Elements
     const roundNumberEl = document.getElementById('round-number');
@@ -19,6 +19,9 @@ document.addEventListener('DOMContentLoaded', () => {
     const actionExplanationsTextEl = document.getElementById('action-explanations-text');
     const logListEl = document.getElementById('log-list');
 
+    // Local mirror of the broadcast game state; 'game_update_delta' messages are merged into it
+    let lastGameState = null;
+
     socket.on('connect', () => {
         console.log('Connected to server. My Player ID:', myPlayerId);
         socket.emit('request_initial_state'); // Ask for current game state
@@ -33,6 +36,7 @@ document.addEventListener('DOMContentLoaded', () => {
     socket.on('game_update', (data) => {
         console.log('Game Update:', data);
         if (data.game_state) {
+            lastGameState = data.game_state;
             updateGameDisplay(data.game_state);
         }
         if (data.event) {
@@ -40,10 +44,23 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     });
 
+    socket.on('game_update_delta', (data) => {
+        if (!lastGameState) { // Nothing to apply the delta to yet; ask for a full state
+            socket.emit('request_initial_state');
+            return;
+        }
+        Object.assign(lastGameState, data.state_delta);
+        data.players_delta.forEach(pd => Object.assign(lastGameState.players[pd.index], pd.changes));
+        updateGameDisplay(lastGameState);
+        if (data.event) {
+            logGameEvent(data.event, lastGameState);
+        }
+    });
+
     socket.on('request_player_action', (data) => {
         console.log('Request Player Action:', data);
         // Ensure game_state_for_player is used if provided, otherwise use last known game_state
-        const currentGameState = data.game_state_for_player || (game_engine_instance ? game_engine_instance.game_state : null);
+        const currentGameState = data.game_state_for_player || lastGameState;
         if (currentGameState) { // Update display before prompting
             updateGameDisplay(currentGameState);
         }
@@ -55,8 +72,18 @@ document.addEventListener('DOMContentLoaded', () => {
         }
     });
 
+    // Reconnect/refresh snapshot: the full state plus the pending action request (or null) in one message
+    socket.on('sync', (data) => {
+        console.log('Sync:', data);
+        lastGameState = data.game_state;
+        updateGameDisplay(data.game_state);
+        if (data.request && data.request.player_id_to_act === myPlayerId) {
+            promptPlayerAction(data.request.player_id_to_act, data.request.allowed_actions, data.game_state);
+        }
+    });
+
     socket.on('round_start_banner', (data) => {
-        logMessage(data.message || `--- STARTING ROUND ${data.round_number} ---`, 'event-banner');
+        logMessage(`--- STARTING ROUND ${data.round_number} ---`, 'event-banner');
     });
 
     socket.on('round_results', (data) => {
@@ -255,7 +282,7 @@ document.addEventListener('DOMContentLoaded', () => {
                 message += ` ${amount}`;
             } else if (actionType === 'raise') {
                 message += ` to ${amount}`;
-            } else if (action_type === 'small_blind' || action_type === 'big_blind'){
+            } else if (actionType === 'small_blind' || actionType === 'big_blind'){
                  message = `${pId} posts ${actionType.replace('_',' ')} (${amount})`;
             }
         } else if (event.type === 'community_cards_dealt') {
@@ -308,5 +335,3 @@ document.addEventListener('DOMContentLoaded', () => {
         logMessage("Press Enter or wait for next round...", "info"); // Placeholder for actual continue mechanism
     }
 });
-
-```
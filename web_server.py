@@ -1,20 +1,35 @@
+# eventlet must patch the standard library before anything else imports it
+try:
+    import eventlet
+    import eventlet.wsgi
+    eventlet.monkey_patch()
+    ASYNC_MODE = 'eventlet'
+except ImportError: # Optional; Flask-SocketIO falls back to its threading mode
+    ASYNC_MODE = None
+
 from flask import Flask, render_template, request, jsonify
-from flask_socketio import SocketIO, emit
+from flask_socketio import SocketIO
 import threading
-import queue
+import socket
+import os
 import logging # Added logging
 
 # Game components will be imported properly in the next step
 from poker_game.core.game_engine import GameEngine
-from poker_game.interfaces.web_interface import WebInterface
+from poker_game.interfaces.web_interface import WebInterface, SocketIOJSON
 from poker_game.core.player import HumanPlayer, Player # Added Player
 from poker_game.core.bot_player import RandomBot, TightBot, AggressiveBot # Added AggressiveBot
 from poker_game.core.events import EventSystem
 from poker_game.storage.memory_storage import MemoryRepository
 from poker_game.config import settings
-from poker_game.core.game_state import Action
+from poker_game.core.events import Action
 from typing import Optional # Added Optional
 
+try:
+    import orjson # Optional, faster parsing of posted actions
+except ImportError:
+    orjson = None
+
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -22,62 +37,52 @@ logger = logging.getLogger(__name__)
 
 app = Flask(__name__, template_folder='poker_game/web/templates', static_folder='poker_game/web/static')
 app.config['SECRET_KEY'] = 'your_very_secret_key_for_flask_sessions_and_socketio'
-socketio = SocketIO(app, async_mode=None, logger=True, engineio_logger=True)
+# Per-packet loggers format the whole state payload on every emit; only enable them when asked (POKER_WS_LOG=1)
+WS_LOG = os.environ.get('POKER_WS_LOG') == '1'
+socketio = SocketIO(app, async_mode=ASYNC_MODE, logger=WS_LOG, engineio_logger=WS_LOG, json=SocketIOJSON)
+if not WS_LOG:
+    logging.getLogger('werkzeug').setLevel(logging.WARNING) # No access line per /submit_action or polling request
 
 # --- Global Game Management ---
 game_engine_instance: Optional[GameEngine] = None
 web_interface_instance: Optional[WebInterface] = None
-action_queue = queue.Queue()
-game_thread: Optional[threading.Thread] = None
+game_running = threading.Event() # Set while the engine's background task is running
 game_lock = threading.Lock()
 
 HUMAN_PLAYER_ID = "Player1"
 
-def get_bot_by_type(bot_type_name: str, bot_id: str, stack: int) -> Optional[Player]:
-    if bot_type_name == "RandomBot":
-        return RandomBot(player_id=bot_id, stack=stack)
-    elif bot_type_name == "TightBot":
-        return TightBot(player_id=bot_id, stack=stack)
-    elif bot_type_name == "AggressiveBot":
-        return AggressiveBot(player_id=bot_id, stack=stack)
-    logger.warning(f"Unknown bot type: {bot_type_name}")
-    return None
+BOT_CLASSES = {
+    "RandomBot": RandomBot,
+    "TightBot": TightBot,
+    "AggressiveBot": AggressiveBot
+}
 
 def initialize_and_start_game():
-    global game_engine_instance, web_interface_instance, game_thread, action_queue
+    global game_engine_instance, web_interface_instance
 
+    # Double-checked: the common "already running" case returns without touching game_lock
+    if game_engine_instance is not None and game_running.is_set():
+        return
     with game_lock:
-        if game_engine_instance is None or (game_thread and not game_thread.is_alive()):
+        if game_engine_instance is None or not game_running.is_set():
             logger.info("Initializing new game for web interface...")
 
             event_system = EventSystem()
             repository = MemoryRepository()
 
-            while not action_queue.empty():
-                try:
-                    action_queue.get_nowait()
-                except queue.Empty:
-                    break
-
             web_interface_instance = WebInterface(
                 socketio_instance=socketio,
-                action_queue=action_queue,
                 human_player_id_for_view=HUMAN_PLAYER_ID
             )
 
             players: List[Player] = [HumanPlayer(player_id=HUMAN_PLAYER_ID, stack=settings.STARTING_STACK)]
 
-            num_bots_to_add = settings.NUM_BOTS
-            if settings.BOT_TYPES:
-                 for i in range(num_bots_to_add):
-                    bot_type_name = settings.BOT_TYPES[i % len(settings.BOT_TYPES)]
-                    bot_id = f"{bot_type_name}-{i+1}"
-                    bot_player = get_bot_by_type(bot_type_name, bot_id, settings.STARTING_STACK)
-                    if bot_player:
-                        players.append(bot_player)
-            else: # Default to RandomBots if BOT_TYPES is empty
-                for i in range(num_bots_to_add):
-                    players.append(RandomBot(player_id=f"RandomBot-{i+1}", stack=settings.STARTING_STACK))
+            bot_types = settings.BOT_TYPES or ["RandomBot"] # Default to RandomBots if BOT_TYPES is empty
+            for unknown_type in set(bot_types) - BOT_CLASSES.keys():
+                logger.warning(f"Unknown bot type: {unknown_type}")
+            cycled_types = [bot_types[i % len(bot_types)] for i in range(settings.NUM_BOTS)]
+            players += [BOT_CLASSES[bot_type_name](player_id=f"{bot_type_name}-{i+1}", stack=settings.STARTING_STACK)
+                        for i, bot_type_name in enumerate(cycled_types) if bot_type_name in BOT_CLASSES]
 
 
             current_game_id = "web_poker_session"
@@ -91,34 +96,55 @@ def initialize_and_start_game():
             )
             # web_interface_instance.set_game_engine(game_engine_instance) # If needed
 
-            logger.info(f"Starting GameEngine in a new thread for game_id: {current_game_id}")
-            game_thread = threading.Thread(target=game_engine_instance.start_game, daemon=True)
-            game_thread.start()
+            logger.info(f"Starting GameEngine as a background task for game_id: {current_game_id}")
+            game_running.set() # Set before the task starts so a concurrent caller sees the game as running
+            socketio.start_background_task(_run_game, game_engine_instance)
         else:
             logger.info("Game is already running or thread active.")
 
+def _run_game(engine: GameEngine) -> None:
+    try:
+        engine.start_game()
+    finally:
+        engine.interface.close() # Otherwise its emitter task would wait on the queue forever
+        if engine is game_engine_instance: # A newer game may already have replaced this one
+            game_running.clear()
+
+_rendered_index: Optional[str] = None # game.html only depends on the constant HUMAN_PLAYER_ID; rendered once
+
 @app.route('/')
 def index():
+    global _rendered_index
     logger.info(f"Route / accessed by {request.remote_addr}")
-    if game_engine_instance is None or (game_thread and not game_thread.is_alive()):
+    if game_engine_instance is None or not game_running.is_set():
          initialize_and_start_game()
-    return render_template('game.html', human_player_id=HUMAN_PLAYER_ID)
+    if _rendered_index is None:
+        _rendered_index = render_template('game.html', human_player_id=HUMAN_PLAYER_ID)
+    return _rendered_index
 
 @app.route('/submit_action', methods=['POST'])
 def submit_action_route():
-    global action_queue, game_engine_instance, web_interface_instance # web_interface_instance added
-    if not game_engine_instance or not game_engine_instance.game_state or game_engine_instance.game_state.is_game_over:
+    ge = game_engine_instance # Bound once; the globals can be swapped by a new game mid-request anyway
+    wi = web_interface_instance
+    gs = ge.game_state if ge else None
+    # Lock-free: game_lock only guards constructing a game, never the action path
+    if not game_running.is_set() or not gs or gs.is_game_over:
         logger.warning("Action submitted but game is not active.")
         return jsonify({"status": "error", "message": "Game not active or over."}), 400
 
-    data = request.json
-    logger.info(f"Received action data via POST: {data}")
-
-    player_id = data.get('player_id')
-    action_type = data.get('action_type')
-    amount_str = data.get('amount', "0") # Amount might come as string
+    if orjson is not None:
+        try:
+            data = orjson.loads(request.get_data(cache=False))
+        except orjson.JSONDecodeError:
+            data = None
+    else:
+        data = request.get_json(cache=False, silent=True)
+    if not isinstance(data, dict):
+        data = {}
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Received action data via POST from {request.remote_addr}: {data}")
 
-    if not player_id or not action_type:
+    if not (player_id := data.get('player_id')) or not (action_type := data.get('action_type')):
         logger.error(f"Missing player_id or action_type in submitted action: {data}")
         return jsonify({"status": "error", "message": "Missing player_id or action_type"}), 400
 
@@ -126,98 +152,124 @@ def submit_action_route():
         logger.warning(f"Action submitted for non-human player {player_id}. Ignoring.")
         return jsonify({"status": "error", "message": "Action only allowed for designated human player."}), 403
 
+    amount_str = data.get('amount', "0") # Amount might come as string
     try:
         action_amount = int(amount_str)
-    except ValueError:
+    except (TypeError, ValueError):
         logger.error(f"Invalid amount format for action: {amount_str}")
         return jsonify({"status": "error", "message": "Invalid amount format."}), 400
 
     game_action = Action(type=action_type, amount=action_amount, player_id=player_id)
 
-    logger.info(f"Putting action onto queue for player {player_id}: {game_action}")
-    action_queue.put(game_action)
+    logger.debug("Delivering action for player %s: %s", player_id, game_action)
+    if not wi or not wi.submit_action(game_action):
+        logger.warning(f"Action submitted by {player_id} while no action was requested from them.")
+        return jsonify({"status": "error", "message": "Not waiting for an action from this player."}), 409
 
     return jsonify({"status": "success", "message": "Action received by server."})
 
 # --- SocketIO Event Handlers ---
+def _send_full_sync(sid: str) -> bool:
+    """
+    Sends client 'sid' the current state plus the pending human action request (if any) as one
+    'sync' message. Returns False when there is no game state to send yet.
+    """
+    wi = web_interface_instance
+    engine = game_engine_instance
+    if not wi or not engine or not engine.game_state:
+        return False
+    gs = engine.game_state
+
+    action_request = None
+    players = gs.players
+    idx = gs.current_player_turn_index
+    if players and 0 <= idx < len(players):
+        to_act = players[idx]
+        if to_act.player_id == HUMAN_PLAYER_ID and not (to_act.is_folded or to_act.is_all_in):
+            action_request = {
+                "player_id_to_act": to_act.player_id,
+                "allowed_actions": engine.rules.get_allowed_actions(to_act, gs)
+            }
+    # State and pending request travel as one message, queued behind any deltas already pending
+    wi.send_sync(sid, gs, action_request)
+    return True
+
 @socketio.on('connect')
 def handle_connect():
-    global web_interface_instance # Ensure it's accessible
-    logger.info(f'Client connected: {request.sid}')
-    if game_engine_instance is None or (game_thread and not game_thread.is_alive()):
+    sid = request.sid
+    logger.info(f'Client connected: {sid}')
+    if game_engine_instance is None or not game_running.is_set():
         logger.info("Game not running, initializing on connect.")
         initialize_and_start_game()
 
-    # Ensure instance is available before trying to use it
-    if web_interface_instance and game_engine_instance and game_engine_instance.game_state:
-        logger.info(f"Game in progress, sending current state to new client {request.sid}")
-        state_json = web_interface_instance._game_state_to_json(game_engine_instance.game_state, HUMAN_PLAYER_ID)
-        emit('game_update', {'game_state': state_json}, room=request.sid)
-
-        gs = game_engine_instance.game_state
-        if gs.players and 0 <= gs.current_player_turn_index < len(gs.players):
-            current_player_to_act = gs.players[gs.current_player_turn_index]
-            if current_player_to_act.player_id == HUMAN_PLAYER_ID and \
-               not current_player_to_act.is_folded and \
-               not current_player_to_act.is_all_in:
-                allowed = game_engine_instance.rules.get_allowed_actions(current_player_to_act, gs)
-                payload = {
-                    "player_id_to_act": current_player_to_act.player_id,
-                    "allowed_actions": allowed,
-                    "game_state_for_player": state_json
-                }
-                logger.info(f"Re-emitting 'request_player_action' to client {request.sid} for player {HUMAN_PLAYER_ID}")
-                emit('request_player_action', payload, room=request.sid)
-    else:
+    # Clients identify their player in the connect query so private messages can be sent only to them
+    wi = web_interface_instance # Read after initialize_and_start_game may have replaced it
+    connect_player_id = request.args.get('player_id')
+    if wi and connect_player_id:
+        wi.register_sid(connect_player_id, sid)
+
+    if not _send_full_sync(sid):
         logger.info("Game engine or web interface not ready on connect, client may need to request initial state.")
 
 
 @socketio.on('disconnect')
 def handle_disconnect():
-    logger.info(f'Client disconnected: {request.sid}')
+    sid = request.sid
+    logger.info(f'Client disconnected: {sid}')
+    wi = web_interface_instance
+    if wi:
+        wi.unregister_sid(sid)
 
 @socketio.on('request_initial_state')
 def handle_request_initial_state():
-    global web_interface_instance # Ensure it's accessible
-    logger.info(f"Client {request.sid} requested initial state.")
-    if web_interface_instance and game_engine_instance and game_engine_instance.game_state:
-        state_json = web_interface_instance._game_state_to_json(game_engine_instance.game_state, HUMAN_PLAYER_ID)
-        emit('game_update', {'game_state': state_json}, room=request.sid)
-
-        gs = game_engine_instance.game_state
-        if gs.players and 0 <= gs.current_player_turn_index < len(gs.players):
-            current_player_to_act = gs.players[gs.current_player_turn_index]
-            if current_player_to_act.player_id == HUMAN_PLAYER_ID and \
-               not current_player_to_act.is_folded and \
-               not current_player_to_act.is_all_in:
-                allowed = game_engine_instance.rules.get_allowed_actions(current_player_to_act, gs)
-                payload = { "player_id_to_act": current_player_to_act.player_id, "allowed_actions": allowed, "game_state_for_player": state_json }
-                emit('request_player_action', payload, room=request.sid)
-    else:
+    sid = request.sid
+    logger.info(f"Client {sid} requested initial state.")
+    if not _send_full_sync(sid):
         logger.info("No active game to send initial state from for request_initial_state.")
 
-if __name__ == '__main__':
-    logger.info("Starting Flask-SocketIO server on http://localhost:5000")
+def _nodelay_server_kwargs() -> dict:
+    """
+    Server kwargs that disable Nagle's algorithm on every accepted connection, so the small
+    game_update frames go out immediately instead of waiting on delayed ACKs.
+    """
+    if ASYNC_MODE == 'eventlet':
+        from eventlet.wsgi import HttpProtocol
+
+        class NoDelayProtocol(HttpProtocol):
+            def setup(self):
+                super().setup()
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        return {'protocol': NoDelayProtocol}
+
+    from werkzeug.serving import WSGIRequestHandler
+
+    class NoDelayHandler(WSGIRequestHandler):
+        disable_nagle_algorithm = True # StreamRequestHandler.setup() sets TCP_NODELAY
+
+    return {'request_handler': NoDelayHandler}
+
+def run_server(host: str = '0.0.0.0', port: int = 5000) -> None:
+    """Starts the web server. Shared by `python web_server.py` and `python -m poker_game.main --mode web`."""
+    debug = os.environ.get('POKER_DEBUG') == '1' # Werkzeug debugger and per-request debug plumbing only on demand
+    logger.info(f"Starting Flask-SocketIO server on http://localhost:{port}")
     # Game initialization is triggered by the first client connecting or accessing the '/' route.
+    server_kwargs = _nodelay_server_kwargs()
     try:
-        # Use eventlet for async_mode if available, otherwise Flask dev server's default.
-        # For production, 'eventlet' or 'gevent' with 'gevent-websocket' is recommended.
-        socketio.run(app, host='0.0.0.0', port=5000, debug=True, use_reloader=False, allow_unsafe_werkzeug=True)
+        if ASYNC_MODE == 'eventlet' and not debug:
+            # Serve straight from eventlet's WSGI server (WebSocket capable); Werkzeug is not involved at all.
+            # The SocketIO middleware is already installed on app.wsgi_app.
+            listener = eventlet.listen((host, port))
+            eventlet.wsgi.server(listener, app, log_output=False, **server_kwargs)
+        else:
+            # Without eventlet this is the Flask dev server, which only does WebSocket via simple-websocket.
+            socketio.run(app, host=host, port=port, debug=debug, use_reloader=False, allow_unsafe_werkzeug=True, **server_kwargs)
     except RuntimeError as e: # Catch common errors like "Eventlet is not installed"
         logger.error(f"RuntimeError starting SocketIO server (maybe eventlet/gevent missing or port in use?): {e}")
         logger.info("Attempting fallback to app.run() without full SocketIO capabilities.")
-        app.run(host='0.0.0.0', port=5000, debug=True, use_reloader=False)
+        app.run(host=host, port=port, debug=debug, use_reloader=False, request_handler=server_kwargs.get('request_handler'))
     except Exception as e:
         logger.error(f"An unexpected error occurred while starting the server: {e}")
-```
-
-**Key changes in this version of `web_server.py`:**
-*   Properly imported game components.
-*   Added `Optional` type hint.
-*   Added more logging.
-*   Refined `initialize_and_start_game` to clear the action queue and correctly select bot types.
-*   Ensured `web_interface_instance` is globally accessible for `handle_connect` and `handle_request_initial_state`.
-*   Added `allow_unsafe_werkzeug=True` to `socketio.run` for newer Werkzeug versions if `debug=True` and `use_reloader=False` causes issues (common in some setups).
-*   The call to `initialize_and_start_game()` in `if __name__ == '__main__':` block is commented out because it's better to initialize on first client connection or first access to `/` route to ensure `socketio` object is fully ready. The `index()` route and `handle_connect` now handle this.
-
-Now, retrying the launch.
+
+if __name__ == '__main__':
+    run_server()